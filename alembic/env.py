@@ -3,11 +3,8 @@
 from __future__ import annotations
 
 from logging.config import fileConfig
-from pathlib import Path
 
 from alembic import context
-from sqlalchemy import engine_from_config
-from sqlalchemy.engine import Connection
 
 from spectrallibrary.db import Base, create_engine
 
@@ -26,12 +23,19 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
-def _get_url() -> str:
+def _get_engine():
+    """Build the migration engine, honouring an explicit ini URL override."""
+
     url = config.get_main_option("sqlalchemy.url")
     if url and "spectral-library.db" not in url:
-        return url
-    engine = create_engine()
-    return engine.url.render_as_string(hide_password=False)
+        from sqlalchemy import create_engine as sa_create_engine
+
+        return sa_create_engine(url)
+    return create_engine()
+
+
+def _get_url() -> str:
+    return _get_engine().url.render_as_string(hide_password=False)
 
 
 def run_migrations_offline() -> None:
@@ -43,6 +47,8 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transactional_ddl=True,
+        transaction_per_migration=False,
     )
 
     with context.begin_transaction():
@@ -52,15 +58,15 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
 
-    connectable = engine_from_config(
-        config.get_section(config.config_ini_section, {}),
-        prefix="sqlalchemy.",
-        poolclass=None,
-        url=_get_url(),
-    )
+    connectable = _get_engine()
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transactional_ddl=True,
+            transaction_per_migration=False,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
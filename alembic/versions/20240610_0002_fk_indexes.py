@@ -0,0 +1,34 @@
+"""Add explicit indexes for foreign keys and change-log lookups.
+
+SQLite does not create indexes for foreign keys automatically, so point
+loads and cascade deletes scanned the full child tables.
+
+Revision ID: 20240610_0002
+Revises: 20231105_0001
+Create Date: 2024-06-10 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20240610_0002"
+down_revision = "20231105_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_spectra_material_id", "spectra", ["material_id"])
+    op.create_index("ix_spectra_source_file_id", "spectra", ["source_file_id"])
+    op.create_index("ix_spectrum_points_spectrum_id", "spectrum_points", ["spectrum_id"])
+    op.create_index("ix_spectrum_tags_tag_id", "spectrum_tags", ["tag_id"])
+    op.create_index("ix_change_log_entity", "change_log", ["entity_type", "entity_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_change_log_entity", table_name="change_log")
+    op.drop_index("ix_spectrum_tags_tag_id", table_name="spectrum_tags")
+    op.drop_index("ix_spectrum_points_spectrum_id", table_name="spectrum_points")
+    op.drop_index("ix_spectra_source_file_id", table_name="spectra")
+    op.drop_index("ix_spectra_material_id", table_name="spectra")
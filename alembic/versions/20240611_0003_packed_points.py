@@ -0,0 +1,67 @@
+"""Add packed point storage on spectra.
+
+Stores each spectrum's samples as one contiguous little-endian float32
+blob (wavelength, reflectance, uncertainty) so plotting reads one row
+instead of thousands. Existing spectrum_points rows are packed in place.
+
+Revision ID: 20240611_0003
+Revises: 20240610_0002
+Create Date: 2024-06-11 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20240611_0003"
+down_revision = "20240610_0002"
+branch_labels = None
+depends_on = None
+
+_POINTS_DTYPE = "<f4"
+
+
+def upgrade() -> None:
+    op.add_column("spectra", sa.Column("points_blob", sa.LargeBinary(), nullable=True))
+    op.add_column("spectra", sa.Column("points_count", sa.Integer(), nullable=True))
+    op.add_column("spectra", sa.Column("points_dtype", sa.String(length=10), nullable=True))
+
+    connection = op.get_bind()
+    spectrum_ids = connection.execute(sa.text("SELECT id FROM spectra")).scalars().all()
+    for spectrum_id in spectrum_ids:
+        rows = connection.execute(
+            sa.text(
+                "SELECT wavelength, reflectance, uncertainty FROM spectrum_points "
+                "WHERE spectrum_id = :sid ORDER BY order_index"
+            ),
+            {"sid": spectrum_id},
+        ).all()
+        if not rows:
+            continue
+        samples = np.array(
+            [
+                (wavelength, reflectance, np.nan if uncertainty is None else uncertainty)
+                for wavelength, reflectance, uncertainty in rows
+            ],
+            dtype=_POINTS_DTYPE,
+        )
+        connection.execute(
+            sa.text(
+                "UPDATE spectra SET points_blob = :blob, points_count = :count, "
+                "points_dtype = :dtype WHERE id = :sid"
+            ),
+            {
+                "blob": samples.tobytes(),
+                "count": len(rows),
+                "dtype": _POINTS_DTYPE,
+                "sid": spectrum_id,
+            },
+        )
+
+
+def downgrade() -> None:
+    op.drop_column("spectra", "points_dtype")
+    op.drop_column("spectra", "points_count")
+    op.drop_column("spectra", "points_blob")
@@ -0,0 +1,48 @@
+"""Store change_log.entity_id as an integer.
+
+All entity ids in this schema are integers; storing them as text doubled
+key size and blocked range scans. Also replaces the plain entity index
+with a composite (entity_type, entity_id, created_at) one for audit
+lookups.
+
+Revision ID: 20240612_0004
+Revises: 20240611_0003
+Create Date: 2024-06-12 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20240612_0004"
+down_revision = "20240611_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_change_log_entity", table_name="change_log")
+    with op.batch_alter_table("change_log", recreate="auto") as batch:
+        batch.alter_column(
+            "entity_id",
+            existing_type=sa.String(length=50),
+            type_=sa.BigInteger(),
+            postgresql_using="entity_id::bigint",
+        )
+    op.create_index(
+        "ix_change_log_entity_time",
+        "change_log",
+        ["entity_type", "entity_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_change_log_entity_time", table_name="change_log")
+    with op.batch_alter_table("change_log", recreate="auto") as batch:
+        batch.alter_column(
+            "entity_id",
+            existing_type=sa.BigInteger(),
+            type_=sa.String(length=50),
+        )
+    op.create_index("ix_change_log_entity", "change_log", ["entity_type", "entity_id"])
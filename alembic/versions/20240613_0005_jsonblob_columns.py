@@ -0,0 +1,83 @@
+"""Store version snapshots and change-log payloads as compressed blobs.
+
+spectrum_versions.metadata_snapshot and change_log.payload move from
+generic JSON (TEXT on SQLite) to the JSONBlob type: JSONB on PostgreSQL,
+gzipped UTF-8 in a BLOB elsewhere. Existing SQLite rows are compressed
+in place.
+
+Revision ID: 20240613_0005
+Revises: 20240612_0004
+Create Date: 2024-06-13 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import gzip
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20240613_0005"
+down_revision = "20240612_0004"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = (
+    ("spectrum_versions", "metadata_snapshot"),
+    ("change_log", "payload"),
+)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        for table, column in _COLUMNS:
+            with op.batch_alter_table(table) as batch:
+                batch.alter_column(
+                    column,
+                    existing_type=sa.JSON(),
+                    type_=sa.dialects.postgresql.JSONB(),
+                    postgresql_using=f"{column}::jsonb",
+                )
+        return
+
+    for table, column in _COLUMNS:
+        rows = connection.execute(
+            sa.text(f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL")
+        ).all()
+        with op.batch_alter_table(table, recreate="auto") as batch:
+            batch.alter_column(
+                column, existing_type=sa.JSON(), type_=sa.LargeBinary()
+            )
+        for row_id, raw in rows:
+            connection.execute(
+                sa.text(f"UPDATE {table} SET {column} = :blob WHERE id = :row_id"),
+                {"blob": gzip.compress(str(raw).encode("utf-8")), "row_id": row_id},
+            )
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        for table, column in _COLUMNS:
+            with op.batch_alter_table(table) as batch:
+                batch.alter_column(
+                    column,
+                    existing_type=sa.dialects.postgresql.JSONB(),
+                    type_=sa.JSON(),
+                )
+        return
+
+    for table, column in _COLUMNS:
+        rows = connection.execute(
+            sa.text(f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL")
+        ).all()
+        with op.batch_alter_table(table, recreate="auto") as batch:
+            batch.alter_column(
+                column, existing_type=sa.LargeBinary(), type_=sa.JSON()
+            )
+        for row_id, blob in rows:
+            connection.execute(
+                sa.text(f"UPDATE {table} SET {column} = :raw WHERE id = :row_id"),
+                {"raw": gzip.decompress(blob).decode("utf-8"), "row_id": row_id},
+            )
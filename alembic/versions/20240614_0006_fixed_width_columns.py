@@ -0,0 +1,75 @@
+"""Use fixed-width and enum types for hash and status columns.
+
+sha256 hex digests are always exactly 64 characters, so CHAR(64) avoids
+varlena overhead on PostgreSQL; the free-form status strings become
+proper enums.
+
+Revision ID: 20240614_0006
+Revises: 20240613_0005
+Create Date: 2024-06-14 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20240614_0006"
+down_revision = "20240613_0005"
+branch_labels = None
+depends_on = None
+
+_SOURCEFILE_STATUS = sa.Enum("success", "failed", "partial", name="sourcefile_status")
+_QUALITY_STATUS = sa.Enum("complete", "incomplete", "review", name="spectrum_quality_status")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _SOURCEFILE_STATUS.create(bind, checkfirst=True)
+    _QUALITY_STATUS.create(bind, checkfirst=True)
+
+    with op.batch_alter_table("source_files", recreate="auto") as batch:
+        batch.alter_column(
+            "sha256", existing_type=sa.String(length=64), type_=sa.CHAR(length=64)
+        )
+        batch.alter_column(
+            "status",
+            existing_type=sa.String(length=30),
+            type_=_SOURCEFILE_STATUS,
+            existing_server_default="success",
+            postgresql_using="status::sourcefile_status",
+        )
+
+    with op.batch_alter_table("spectra", recreate="auto") as batch:
+        batch.alter_column(
+            "quality_status",
+            existing_type=sa.String(length=30),
+            type_=_QUALITY_STATUS,
+            existing_server_default="complete",
+            postgresql_using="quality_status::spectrum_quality_status",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("spectra", recreate="auto") as batch:
+        batch.alter_column(
+            "quality_status",
+            existing_type=_QUALITY_STATUS,
+            type_=sa.String(length=30),
+            existing_server_default="complete",
+        )
+
+    with op.batch_alter_table("source_files", recreate="auto") as batch:
+        batch.alter_column(
+            "status",
+            existing_type=_SOURCEFILE_STATUS,
+            type_=sa.String(length=30),
+            existing_server_default="success",
+        )
+        batch.alter_column(
+            "sha256", existing_type=sa.CHAR(length=64), type_=sa.String(length=64)
+        )
+
+    bind = op.get_bind()
+    _QUALITY_STATUS.drop(bind, checkfirst=True)
+    _SOURCEFILE_STATUS.drop(bind, checkfirst=True)
@@ -0,0 +1,27 @@
+"""Index spectra.acquisition_date for date-range filters.
+
+Library filtering is already covered by the leading column of
+uq_material_library_name_material_name; acquisition-date range scans had
+no index at all.
+
+Revision ID: 20240615_0007
+Revises: 20240614_0006
+Create Date: 2024-06-15 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "20240615_0007"
+down_revision = "20240614_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_spectra_acquisition_date", "spectra", ["acquisition_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_spectra_acquisition_date", table_name="spectra")
@@ -0,0 +1,83 @@
+"""Split the packed point blob into per-channel arrays.
+
+The interleaved (wavelength, reflectance, uncertainty) blob forced a
+strided slice to recover any single channel. Storing one contiguous
+blob per channel lets readers decode exactly the arrays they need with
+a zero-copy frombuffer, and spectra without uncertainty stop paying a
+third of the blob for NaN padding.
+
+Revision ID: 20240616_0008
+Revises: 20240615_0007
+Create Date: 2024-06-16 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20240616_0008"
+down_revision = "20240615_0007"
+branch_labels = None
+depends_on = None
+
+_POINTS_DTYPE = "<f4"
+
+
+def upgrade() -> None:
+    op.add_column("spectra", sa.Column("wavelengths_blob", sa.LargeBinary(), nullable=True))
+    op.add_column("spectra", sa.Column("reflectance_blob", sa.LargeBinary(), nullable=True))
+    op.add_column("spectra", sa.Column("uncertainty_blob", sa.LargeBinary(), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, points_blob, points_dtype FROM spectra WHERE points_blob IS NOT NULL")
+    ).all()
+    for spectrum_id, blob, dtype in rows:
+        samples = np.frombuffer(blob, dtype=dtype or _POINTS_DTYPE).reshape(-1, 3)
+        uncertainty = samples[:, 2]
+        connection.execute(
+            sa.text(
+                "UPDATE spectra SET wavelengths_blob = :w, reflectance_blob = :r, "
+                "uncertainty_blob = :u WHERE id = :sid"
+            ),
+            {
+                "w": np.ascontiguousarray(samples[:, 0]).tobytes(),
+                "r": np.ascontiguousarray(samples[:, 1]).tobytes(),
+                "u": None if np.isnan(uncertainty).all() else np.ascontiguousarray(uncertainty).tobytes(),
+                "sid": spectrum_id,
+            },
+        )
+
+    with op.batch_alter_table("spectra") as batch_op:
+        batch_op.drop_column("points_blob")
+
+
+def downgrade() -> None:
+    op.add_column("spectra", sa.Column("points_blob", sa.LargeBinary(), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text(
+            "SELECT id, wavelengths_blob, reflectance_blob, uncertainty_blob, points_dtype "
+            "FROM spectra WHERE wavelengths_blob IS NOT NULL"
+        )
+    ).all()
+    for spectrum_id, wavelengths, reflectance, uncertainty, dtype in rows:
+        dtype = dtype or _POINTS_DTYPE
+        count = len(wavelengths) // np.dtype(dtype).itemsize
+        samples = np.full((count, 3), np.nan, dtype=dtype)
+        samples[:, 0] = np.frombuffer(wavelengths, dtype=dtype)
+        samples[:, 1] = np.frombuffer(reflectance, dtype=dtype)
+        if uncertainty is not None:
+            samples[:, 2] = np.frombuffer(uncertainty, dtype=dtype)
+        connection.execute(
+            sa.text("UPDATE spectra SET points_blob = :blob WHERE id = :sid"),
+            {"blob": samples.tobytes(), "sid": spectrum_id},
+        )
+
+    with op.batch_alter_table("spectra") as batch_op:
+        batch_op.drop_column("uncertainty_blob")
+        batch_op.drop_column("reflectance_blob")
+        batch_op.drop_column("wavelengths_blob")
@@ -0,0 +1,36 @@
+"""Narrow spectrum_points numeric columns to single precision.
+
+Reflectance ratios and instrument wavelengths carry well under seven
+significant digits, so FLOAT(24) (REAL on backends that distinguish it)
+halves the bytes moved per point on insert and read. SQLite stores all
+floats as 8-byte IEEE values regardless, so there the change only
+documents intent; PostgreSQL gets the real bandwidth win.
+
+Revision ID: 20240617_0009
+Revises: 20240616_0008
+Create Date: 2024-06-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "20240617_0009"
+down_revision = "20240616_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("spectrum_points") as batch_op:
+        batch_op.alter_column("wavelength", type_=sa.Float(precision=24), existing_nullable=False)
+        batch_op.alter_column("reflectance", type_=sa.Float(precision=24), existing_nullable=False)
+        batch_op.alter_column("uncertainty", type_=sa.Float(precision=24), existing_nullable=True)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("spectrum_points") as batch_op:
+        batch_op.alter_column("wavelength", type_=sa.Float(), existing_nullable=False)
+        batch_op.alter_column("reflectance", type_=sa.Float(), existing_nullable=False)
+        batch_op.alter_column("uncertainty", type_=sa.Float(), existing_nullable=True)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from .ui import MainWindow, create_application
-
 
 def main() -> None:
     """Launch the PySide6 UI shell."""
 
+    # Imported lazily so that importing this module (entry-point resolution,
+    # test collection) does not pull in PySide6.
+    from .ui import MainWindow, create_application
+
     app = create_application()
     window = MainWindow()
     window.show()
@@ -1,17 +1,17 @@
 """Database infrastructure utilities for the Spectral Library application."""
 
+from .bulkload import bulk_load_indexes
 from .engine import configure_engine, create_engine, get_engine
 from .session import SessionLocal, configure_session, get_session
-from . import models
 from .base import Base
 
 __all__ = [
     "Base",
     "SessionLocal",
+    "bulk_load_indexes",
     "configure_engine",
     "configure_session",
     "create_engine",
     "get_engine",
     "get_session",
-    "models",
 ]
@@ -2,24 +2,60 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from sqlalchemy import create_engine as _create_engine
+from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool, StaticPool
 
+from .session import configure_session
 from .settings import DatabaseSettings, get_database_settings
 
-_ENGINE_CACHE: dict[str, Engine] = {}
+_ENGINE_OVERRIDES: dict[str, Engine] = {}
+_CREATED_DIRS: set[Path] = set()
+_URL_CACHE: dict[tuple[Optional[str], Optional[Path], Path], str] = {}
 
 
 def _build_database_url(settings: DatabaseSettings) -> str:
     if settings.database_url:
         return settings.database_url
+
+    cache_key = (settings.database_url, settings.database_path, settings.app_dir)
+    cached = _URL_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     # default to application data directory / spectral-library.db
     path = Path(settings.database_path or (settings.app_dir / "spectral-library.db"))
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return f"sqlite:///{path.as_posix()}"
+    if path.parent not in _CREATED_DIRS:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _CREATED_DIRS.add(path.parent)
+    url = f"sqlite:///{path.as_posix()}"
+    _URL_CACHE[cache_key] = url
+    return url
+
+
+_SQLITE_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _register_sqlite_pragmas(engine: Engine) -> None:
+    """Tune each new SQLite connection for bulk ingest workloads."""
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_conn, _connection_record) -> None:  # type: ignore[no-untyped-def]
+        cursor = dbapi_conn.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
 
 
 def create_engine(settings: Optional[DatabaseSettings] = None, *, echo: bool | None = None) -> Engine:
@@ -32,35 +68,61 @@ def create_engine(settings: Optional[DatabaseSettings] = None, *, echo: bool | N
 
     settings = settings or get_database_settings()
     database_url = _build_database_url(settings)
-    if database_url.startswith("sqlite"):
-        connect_args = {"check_same_thread": False}
+    is_sqlite = database_url.startswith("sqlite")
+
+    engine_kwargs: dict[str, object] = {
+        "echo": settings.echo if echo is None else echo,
+        "future": True,
+        # Batch size for SQLAlchemy's insertmanyvalues bulk-insert path.
+        "insertmanyvalues_page_size": 1000,
+    }
+    if is_sqlite:
+        # A local file has no stale-connection failure mode, so skip the
+        # pre-ping round trip that networked backends need.
+        engine_kwargs["connect_args"] = {"check_same_thread": False}
+        if ":memory:" in database_url:
+            # Share the single in-memory database across all checkouts.
+            engine_kwargs["poolclass"] = StaticPool
+        elif settings.single_shot:
+            engine_kwargs["poolclass"] = NullPool
     else:
-        connect_args = {}
-
-    engine = _create_engine(
-        database_url,
-        echo=settings.echo if echo is None else echo,
-        future=True,
-        connect_args=connect_args,
-        pool_pre_ping=True,
-    )
+        # LIFO checkout keeps a warm subset of connections busy and lets
+        # idle ones age out via recycle.
+        engine_kwargs["pool_pre_ping"] = True
+        engine_kwargs["pool_use_lifo"] = True
+        engine_kwargs["pool_size"] = settings.pool_size
+        engine_kwargs["max_overflow"] = settings.max_overflow
+        engine_kwargs["pool_recycle"] = settings.pool_recycle
+
+    engine = _create_engine(database_url, **engine_kwargs)
+    if is_sqlite:
+        _register_sqlite_pragmas(engine)
     return engine
 
 
+@lru_cache(maxsize=None)
+def _default_engine(cache_key: str) -> Engine:
+    return create_engine()
+
+
 def get_engine(cache_key: str = "default") -> Engine:
-    """Get (and cache) an engine instance keyed by cache key."""
+    """Get (and cache) an engine instance keyed by cache key.
 
-    if cache_key not in _ENGINE_CACHE:
-        _ENGINE_CACHE[cache_key] = create_engine()
-    return _ENGINE_CACHE[cache_key]
+    The lru_cache holds its internal lock during construction, so two
+    threads racing on a cold key cannot create duplicate engines (and
+    duplicate connection pools) the old dict-check pattern allowed.
+    """
+
+    override = _ENGINE_OVERRIDES.get(cache_key)
+    if override is not None:
+        return override
+    return _default_engine(cache_key)
 
 
 def configure_engine(engine: Engine, cache_key: str = "default") -> None:
     """Override the cached engine (useful for testing)."""
 
-    _ENGINE_CACHE[cache_key] = engine
+    _ENGINE_OVERRIDES[cache_key] = engine
+    _default_engine.cache_clear()
     if cache_key == "default":
-        # Avoid circular import at module level
-        from .session import configure_session
-
         configure_session(engine)
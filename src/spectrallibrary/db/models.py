@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 from sqlalchemy import (
-    JSON,
+    CHAR,
+    BigInteger,
     Date,
     DateTime,
+    Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     Column,
+    LargeBinary,
     String,
     Table,
     Text,
@@ -22,6 +27,10 @@ from sqlalchemy import (
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
+from .types import JSONBlob
+
+# Storage dtype for packed spectrum samples (little-endian float32).
+POINTS_DTYPE = "<f4"
 
 
 class TimestampMixin:
@@ -43,7 +52,18 @@ class Material(TimestampMixin, Base):
     location: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     comments: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    spectra: Mapped[List["Spectrum"]] = relationship("Spectrum", back_populates="material", cascade="all, delete-orphan")
+    spectra: Mapped[List["Spectrum"]] = relationship(
+        "Spectrum",
+        back_populates="material",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        # dated spectra first in chronological order, undated ones last by
+        # id; sorting here lets the database return presorted collections
+        order_by=(
+            "[Spectrum.acquisition_date.is_(None),"
+            " Spectrum.acquisition_date, Spectrum.id]"
+        ),
+    )
 
     __table_args__ = (
         UniqueConstraint("library_name", "material_name", name="uq_material_library_name_material_name"),
@@ -56,50 +76,132 @@ class SourceFile(TimestampMixin, Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     original_name: Mapped[str] = mapped_column(String(255), nullable=False)
     format: Mapped[str] = mapped_column(String(50), nullable=False)
-    sha256: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    sha256: Mapped[str] = mapped_column(CHAR(64), nullable=False, unique=True)
     importer_plugin: Mapped[Optional[str]] = mapped_column(String(120), nullable=True)
-    status: Mapped[str] = mapped_column(String(30), default="success", nullable=False)
+    status: Mapped[str] = mapped_column(
+        Enum("success", "failed", "partial", name="sourcefile_status"),
+        default="success",
+        nullable=False,
+    )
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    spectra: Mapped[List["Spectrum"]] = relationship("Spectrum", back_populates="source_file")
+    spectra: Mapped[List["Spectrum"]] = relationship(
+        "Spectrum", back_populates="source_file", lazy="raise"
+    )
 
 
 class Spectrum(TimestampMixin, Base):
     __tablename__ = "spectra"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    material_id: Mapped[int] = mapped_column(ForeignKey("materials.id", ondelete="CASCADE"), nullable=False)
-    source_file_id: Mapped[Optional[int]] = mapped_column(ForeignKey("source_files.id", ondelete="SET NULL"))
+    material_id: Mapped[int] = mapped_column(
+        ForeignKey("materials.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    source_file_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("source_files.id", ondelete="SET NULL"), index=True
+    )
 
     source: Mapped[str] = mapped_column(String(120), nullable=False)
     wavelength_unit: Mapped[str] = mapped_column(String(20), nullable=False)
     reflectance_unit: Mapped[str] = mapped_column(String(20), nullable=False)
-    acquisition_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
-    quality_status: Mapped[str] = mapped_column(String(30), default="complete", nullable=False)
+    acquisition_date: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True)
+    quality_status: Mapped[str] = mapped_column(
+        Enum("complete", "incomplete", "review", name="spectrum_quality_status"),
+        default="complete",
+        nullable=False,
+    )
     plugin_id: Mapped[Optional[str]] = mapped_column(String(120), nullable=True)
     comments: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    # Packed samples in structure-of-arrays layout: one contiguous
+    # little-endian float32 blob per channel. Far cheaper to read for
+    # plotting than the per-sample rows in spectrum_points, and each
+    # channel decodes to a contiguous array without strided slicing.
+    wavelengths_blob: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    reflectance_blob: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    uncertainty_blob: Mapped[Optional[bytes]] = mapped_column(LargeBinary, nullable=True)
+    points_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    points_dtype: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+
     material: Mapped[Material] = relationship("Material", back_populates="spectra")
-    source_file: Mapped[Optional[SourceFile]] = relationship("SourceFile", back_populates="spectra")
+    source_file: Mapped[Optional[SourceFile]] = relationship(
+        "SourceFile", back_populates="spectra", lazy="raise"
+    )
     points: Mapped[List["SpectrumPoint"]] = relationship(
-        "SpectrumPoint", order_by="SpectrumPoint.order_index", back_populates="spectrum", cascade="all, delete-orphan"
+        "SpectrumPoint",
+        order_by="SpectrumPoint.order_index",
+        back_populates="spectrum",
+        cascade="all, delete-orphan",
+        lazy="raise",
+    )
+    tags: Mapped[List["Tag"]] = relationship(
+        "Tag", secondary="spectrum_tags", back_populates="spectra", lazy="raise"
     )
-    tags: Mapped[List["Tag"]] = relationship("Tag", secondary="spectrum_tags", back_populates="spectra")
     versions: Mapped[List["SpectrumVersion"]] = relationship(
-        "SpectrumVersion", back_populates="spectrum", cascade="all, delete-orphan"
+        "SpectrumVersion", back_populates="spectrum", cascade="all, delete-orphan", lazy="raise"
     )
 
+    def pack_points(
+        self,
+        wavelengths: Sequence[float],
+        reflectance: Sequence[float],
+        uncertainty: Sequence[float] | None = None,
+    ) -> None:
+        """Store each channel as a packed little-endian float32 array."""
+
+        self.wavelengths_blob = np.asarray(wavelengths, dtype=POINTS_DTYPE).tobytes()
+        self.reflectance_blob = np.asarray(reflectance, dtype=POINTS_DTYPE).tobytes()
+        self.uncertainty_blob = (
+            None
+            if uncertainty is None
+            else np.asarray(uncertainty, dtype=POINTS_DTYPE).tobytes()
+        )
+        self.points_count = len(wavelengths)
+        self.points_dtype = POINTS_DTYPE
+
+    def _channel(self, blob: Optional[bytes]) -> Optional[np.ndarray]:
+        if blob is None:
+            return None
+        return np.frombuffer(blob, dtype=self.points_dtype or POINTS_DTYPE)
+
+    @property
+    def wavelength_f32(self) -> Optional[np.ndarray]:
+        """Packed wavelengths as float32, or ``None`` without packed data."""
+
+        return self._channel(self.wavelengths_blob)
+
+    @property
+    def reflectance_f32(self) -> Optional[np.ndarray]:
+        """Packed reflectance as float32, or ``None`` without packed data.
+
+        Reflectance carries ~4 significant digits, so float32 is lossless
+        for practical purposes at half the bandwidth of REAL columns.
+        """
+
+        return self._channel(self.reflectance_blob)
+
+    @property
+    def uncertainty_f32(self) -> Optional[np.ndarray]:
+        """Packed uncertainty as float32, or ``None`` when never recorded."""
+
+        return self._channel(self.uncertainty_blob)
+
 
 class SpectrumPoint(Base):
     __tablename__ = "spectrum_points"
     __table_args__ = (UniqueConstraint("spectrum_id", "order_index", name="uq_spectrum_points_order"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    spectrum_id: Mapped[int] = mapped_column(ForeignKey("spectra.id", ondelete="CASCADE"), nullable=False)
+    spectrum_id: Mapped[int] = mapped_column(
+        ForeignKey("spectra.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     order_index: Mapped[int] = mapped_column(Integer, nullable=False)
-    wavelength: Mapped[float] = mapped_column(Float, nullable=False)
-    reflectance: Mapped[float] = mapped_column(Float, nullable=False)
-    uncertainty: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Single precision: reflectance ratios and instrument wavelengths
+    # carry well under 7 significant digits, so REAL (float32) halves
+    # the wire and storage bytes of a double column.
+    wavelength: Mapped[float] = mapped_column(Float(precision=24), nullable=False)
+    reflectance: Mapped[float] = mapped_column(Float(precision=24), nullable=False)
+    uncertainty: Mapped[Optional[float]] = mapped_column(Float(precision=24), nullable=True)
 
     spectrum: Mapped[Spectrum] = relationship("Spectrum", back_populates="points")
 
@@ -120,6 +222,7 @@ spectrum_tags = Table(
     Column("spectrum_id", ForeignKey("spectra.id", ondelete="CASCADE"), primary_key=True),
     Column("tag_id", ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True),
     UniqueConstraint("spectrum_id", "tag_id", name="uq_spectrum_tag"),
+    Index("ix_spectrum_tags_tag_id", "tag_id"),
 )
 
 
@@ -131,7 +234,7 @@ class SpectrumVersion(Base):
     version_number: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now(), nullable=False)
     reason: Mapped[Optional[str]] = mapped_column(String(120), nullable=True)
-    metadata_snapshot: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    metadata_snapshot: Mapped[Dict[str, Any]] = mapped_column(JSONBlob, nullable=False)
 
     spectrum: Mapped[Spectrum] = relationship("Spectrum", back_populates="versions")
 
@@ -143,13 +246,17 @@ class ChangeLog(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     entity_type: Mapped[str] = mapped_column(String(50), nullable=False)
-    entity_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    entity_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     action: Mapped[str] = mapped_column(String(30), nullable=False)
-    payload: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    payload: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONBlob, nullable=True)
     user: Mapped[Optional[str]] = mapped_column(String(120), nullable=True)
     plugin_id: Mapped[Optional[str]] = mapped_column(String(120), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=func.now(), nullable=False)
 
+    __table_args__ = (
+        Index("ix_change_log_entity_time", "entity_type", "entity_id", "created_at"),
+    )
+
 
 __all__ = [
     "Material",
@@ -0,0 +1,56 @@
+"""Precompiled statements for hot query paths.
+
+These use :func:`sqlalchemy.lambda_stmt` so the statement construction and
+SQL compilation are cached on first use; repeated calls only swap the
+bound parameter values. Import loops and UI refreshes issue these lookups
+once per record, which makes per-call compilation measurable.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from .models import ChangeLog, Material, SourceFile, Tag
+
+
+def select_material_by_identity(
+    library_name: str, material_name: str
+) -> StatementLambdaElement:
+    """Look up a material by its (library_name, material_name) key."""
+
+    stmt = lambda_stmt(lambda: select(Material))
+    stmt += lambda s: s.where(
+        Material.library_name == library_name,
+        Material.material_name == material_name,
+    )
+    return stmt
+
+
+def select_source_file_by_sha256(sha256: str) -> StatementLambdaElement:
+    """Look up a source file by its content hash."""
+
+    stmt = lambda_stmt(lambda: select(SourceFile))
+    stmt += lambda s: s.where(SourceFile.sha256 == sha256)
+    return stmt
+
+
+def select_tag_by_name(name: str) -> StatementLambdaElement:
+    """Look up a tag by its unique name."""
+
+    stmt = lambda_stmt(lambda: select(Tag))
+    stmt += lambda s: s.where(Tag.name == name)
+    return stmt
+
+
+def select_change_log_for_entity(
+    entity_type: str, entity_id: int
+) -> StatementLambdaElement:
+    """Fetch the audit trail for one entity, newest first."""
+
+    stmt = lambda_stmt(lambda: select(ChangeLog))
+    stmt += lambda s: s.where(
+        ChangeLog.entity_type == entity_type,
+        ChangeLog.entity_id == entity_id,
+    ).order_by(ChangeLog.created_at.desc())
+    return stmt
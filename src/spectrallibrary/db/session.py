@@ -8,10 +8,26 @@ from typing import Iterator
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from .engine import get_engine
 
-SessionLocal = sessionmaker(autoflush=False, autocommit=False, expire_on_commit=False)
-SessionLocal.configure(bind=get_engine())
+class _LazySessionFactory(sessionmaker):
+    """Session factory that binds the default engine on first use.
+
+    Deferring the bind keeps ``import spectrallibrary.db`` free of engine
+    construction (and the SQLite file/directory creation it implies) for
+    code paths that never open a session.
+    """
+
+    def __call__(self, **local_kw: object) -> Session:
+        if self.kw.get("bind") is None:
+            # Imported here (once, on first bind) because engine.py imports
+            # configure_session from this module at load time.
+            from .engine import get_engine
+
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionFactory(autoflush=False, autocommit=False, expire_on_commit=False)
 
 
 def configure_session(bind: Engine) -> None:
@@ -2,28 +2,41 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-DEFAULT_APP_DIR = Path.home() / ".spectrallibrary"
+@lru_cache(maxsize=1)
+def default_app_dir() -> Path:
+    """Resolve the per-user application data directory once."""
+
+    return Path.home() / ".spectrallibrary"
 
 
 @dataclass(slots=True)
 class DatabaseSettings:
     """Static configuration for database connections."""
 
-    app_dir: Path = DEFAULT_APP_DIR
+    app_dir: Path = field(default_factory=default_app_dir)
     database_path: Optional[Path] = None
     database_url: Optional[str] = None
     echo: bool = False
+    # Connection pool tuning; only applied to non-SQLite engines.
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_recycle: int = 1800
+    # Set by short-lived CLI entry points that open at most one session.
+    single_shot: bool = False
 
 
+@lru_cache(maxsize=1)
 def get_database_settings() -> DatabaseSettings:
     """Return database settings.
 
     For now this returns defaults; in the future this will read from config files
-    or environment variables.
+    or environment variables. The result is memoized so repeated engine
+    construction does not re-resolve ``Path.home()``.
     """
 
     return DatabaseSettings()
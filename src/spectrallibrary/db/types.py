@@ -0,0 +1,39 @@
+"""Custom column types shared by the ORM models."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Optional
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONBlob(TypeDecorator):
+    """JSON payloads stored as JSONB on PostgreSQL, gzipped UTF-8 elsewhere.
+
+    Generic ``JSON`` maps to TEXT on SQLite and is re-tokenized on every
+    read; the compressed binary form is smaller on disk and cheaper to
+    shuttle for rarely-inspected payloads such as version snapshots.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> Any:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.JSONB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Any:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return gzip.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[Any]:
+        if value is None or dialect.name == "postgresql":
+            return value
+        return json.loads(gzip.decompress(value).decode("utf-8"))
@@ -0,0 +1,120 @@
+"""Dialect-aware get-or-create helpers for import hot loops."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from .models import Material, Tag
+from .queries import select_material_by_identity, select_tag_by_name
+
+_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
+
+def upsert_tag(session: Session, name: str, description: Optional[str] = None) -> Tag:
+    """Insert a tag if absent and return the persistent row.
+
+    On SQLite/PostgreSQL this is a single INSERT ... ON CONFLICT DO
+    NOTHING followed by the (usually cached) lookup, instead of the racy
+    SELECT-then-INSERT pattern. Other dialects fall back to get-or-create.
+    """
+
+    insert_fn = _INSERTS.get(session.get_bind().dialect.name)
+    if insert_fn is not None:
+        session.execute(
+            insert_fn(Tag)
+            .values(name=name, description=description)
+            .on_conflict_do_nothing(index_elements=["name"])
+        )
+    else:
+        existing = session.execute(select_tag_by_name(name)).scalar_one_or_none()
+        if existing is not None:
+            return existing
+        session.add(Tag(name=name, description=description))
+        session.flush()
+    return session.execute(select_tag_by_name(name)).scalar_one()
+
+
+def upsert_tags(session: Session, names: Iterable[str]) -> list[Tag]:
+    """Create any missing tags in one statement and return their rows.
+
+    Coalesces what would otherwise be one upsert round-trip per name
+    into a single multi-row INSERT ... ON CONFLICT DO NOTHING plus one
+    SELECT. Dialects without conflict support fall back per name.
+    """
+
+    names = sorted(set(names))
+    if not names:
+        return []
+
+    insert_fn = _INSERTS.get(session.get_bind().dialect.name)
+    if insert_fn is None:
+        return [upsert_tag(session, name) for name in names]
+
+    session.execute(
+        insert_fn(Tag)
+        .values([{"name": name} for name in names])
+        .on_conflict_do_nothing(index_elements=["name"])
+    )
+    return list(session.execute(select(Tag).where(Tag.name.in_(names))).scalars())
+
+
+def upsert_material(
+    session: Session,
+    library_name: str,
+    material_name: str,
+    category: str,
+    *,
+    location: Optional[str] = None,
+    comments: Optional[str] = None,
+) -> tuple[Material, bool]:
+    """Insert a material if absent; return ``(material, created)``.
+
+    Conflict target is the (library_name, material_name) unique
+    constraint. Existing rows are returned untouched so callers decide
+    which metadata to refresh.
+    """
+
+    insert_fn = _INSERTS.get(session.get_bind().dialect.name)
+    if insert_fn is not None:
+        result = session.execute(
+            insert_fn(Material)
+            .values(
+                library_name=library_name,
+                material_name=material_name,
+                category=category,
+                location=location,
+                comments=comments,
+            )
+            .on_conflict_do_nothing(index_elements=["library_name", "material_name"])
+        )
+        created = bool(result.rowcount)
+    else:
+        existing = session.execute(
+            select_material_by_identity(library_name, material_name)
+        ).scalar_one_or_none()
+        if existing is not None:
+            return existing, False
+        session.add(
+            Material(
+                library_name=library_name,
+                material_name=material_name,
+                category=category,
+                location=location,
+                comments=comments,
+            )
+        )
+        session.flush()
+        created = True
+
+    material = session.execute(
+        select_material_by_identity(library_name, material_name)
+    ).scalar_one()
+    return material, created
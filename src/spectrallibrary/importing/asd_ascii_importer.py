@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
-from .base import ImportContext, ImportResult, SpectrumRecord
+import numpy as np
+
+from .base import ImportContext, ImportResult, SpectrumRecord, read_file_head
 from .registry import register_importer
 
+# matches the CSV importer's 1 MiB buffering for large files
+_READ_BUFFER_SIZE = 1 << 20
+
 
 @dataclass(slots=True)
 class AsdAsciiImporter:
@@ -20,21 +27,19 @@ class AsdAsciiImporter:
         suffix = path.suffix.lower()
         if suffix not in {".sig", ".txt"}:
             return False
-        try:
-            with path.open("r", encoding="utf-8", errors="ignore") as handle:
-                head = "\n".join(handle.readline().strip() for _ in range(5))
-        except OSError:
-            return False
-        lowered = head.lower()
+        lowered = read_file_head(path).lower()
         return any(token in lowered for token in ("asd", "fieldspec", "spectravista"))
 
     def load(self, path: Path, *, context: ImportContext | None = None) -> ImportResult:
         try:
-            lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+            # Stream line-by-line instead of materializing the whole file
+            # as one string plus a line list; .sig files run to many MB.
+            with path.open(
+                "r", encoding="utf-8", errors="ignore", buffering=_READ_BUFFER_SIZE
+            ) as handle:
+                metadata, column_names, data_lines = _split_sections(handle)
         except OSError as exc:
             raise ValueError(f"Unable to read ASD file: {exc}") from exc
-
-        metadata, column_names, data_lines = _split_sections(lines)
         if not column_names:
             raise ValueError("Unable to locate ASD data columns (expected a header row containing 'Wavelength').")
 
@@ -59,9 +64,9 @@ class AsdAsciiImporter:
 
         reflectance_unit = inferred_units
         reflectance_values = reflectance
-        if not reflectance_values:
+        if len(reflectance_values) == 0:
             radiance = parse_result.get("radiance")
-            if radiance:
+            if radiance is not None and len(radiance):
                 reflectance_values = radiance
                 reflectance_unit = "radiance"
                 warnings.append("Reflectance column missing - radiance values stored instead.")
@@ -118,12 +123,33 @@ def _split_sections(lines: Iterable[str]) -> tuple[Dict[str, str], List[str], Li
     return metadata, column_names, data_lines
 
 
+# Splits "Key = value" / "Key: value" in one C-level scan instead of a
+# delimiter loop with two str.split passes.
+_META_RE = re.compile(r"^\s*([^:=]+?)\s*[:=]\s*(.*?)\s*$")
+
+# Canonical forms for the keys the importer actually consults; a dict hit
+# skips the per-line str.title() allocation, unknown keys still get it.
+_CANONICAL_KEYS = {
+    "library": "Library",
+    "sample": "Sample",
+    "target": "Target",
+    "category": "Category",
+    "instrument": "Instrument",
+    "device": "Device",
+    "comments": "Comments",
+    "units": "Units",
+    "location": "Location",
+    "integration time": "Integration Time",
+    "wavelength unit": "Wavelength Unit",
+}
+
+
 def _split_metadata_line(line: str) -> tuple[str | None, str]:
-    for delimiter in ("=", ":"):
-        if delimiter in line:
-            key, value = line.split(delimiter, 1)
-            return key.strip().title(), value.strip()
-    return None, ""
+    match = _META_RE.match(line)
+    if match is None:
+        return None, ""
+    key = match.group(1)
+    return _CANONICAL_KEYS.get(key.lower()) or key.title(), match.group(2)
 
 
 def _parse_numeric_rows(column_names: List[str], data_lines: List[str]) -> Dict[str, Any]:
@@ -132,24 +158,35 @@ def _parse_numeric_rows(column_names: List[str], data_lines: List[str]) -> Dict[
     radiance: List[float] = []
     warnings: List[str] = []
 
-    col_map = {name.lower(): idx for idx, name in enumerate(column_names)}
-
-    def _find_column(*candidates: str) -> int | None:
-        for candidate in candidates:
-            for name, idx in col_map.items():
-                if candidate in name:
-                    return idx
-        return None
-
-    wavelength_idx = _find_column("wavelength")
-    reflectance_idx = _find_column("reflectance", "ratio")
-    radiance_idx = _find_column("radiance", "sample")
+    wavelength_idx, reflectance_idx, radiance_idx = _resolve_columns(tuple(column_names))
 
     if wavelength_idx is None:
         raise ValueError("ASD data missing wavelength column.")
 
+    # Fast path: hand the whole block to NumPy's C parser in one call.
+    # Malformed files (ragged rows, non-numeric cells) fall back to the
+    # row-by-row loop below, which produces per-row warnings.
+    array = _parse_rows_vectorized(data_lines)
+    if array is not None and array.shape[1] > wavelength_idx:
+        # Column views stay ndarrays; SpectrumRecord keeps them as
+        # float32 arrays, so a tolist() round-trip would be pure waste.
+        wavelengths = array[:, wavelength_idx]
+        if reflectance_idx is not None and reflectance_idx < array.shape[1]:
+            reflectance = array[:, reflectance_idx]
+        if radiance_idx is not None and radiance_idx < array.shape[1]:
+            radiance = array[:, radiance_idx]
+        return {
+            "wavelengths": wavelengths,
+            "reflectance": reflectance,
+            "radiance": radiance,
+            "warnings": warnings,
+            "reflectance_unit": "ratio" if len(reflectance) else "radiance",
+        }
+
     for row_number, line in enumerate(data_lines, start=1):
-        parts = [segment for segment in line.replace("\t", " ").split() if segment]
+        # str.split() with no argument already splits on runs of any
+        # whitespace (tabs included), so no intermediate copy is needed.
+        parts = line.split()
         if len(parts) <= wavelength_idx:
             warnings.append(f"Row {row_number}: insufficient columns.")
             continue
@@ -183,6 +220,40 @@ def _parse_numeric_rows(column_names: List[str], data_lines: List[str]) -> Dict[
     }
 
 
+@lru_cache(maxsize=64)
+def _resolve_columns(header: tuple[str, ...]) -> tuple[int | None, int | None, int | None]:
+    """Map a header tuple to (wavelength, reflectance, radiance) indexes.
+
+    ASD exports from one instrument share a header shape, so the substring
+    scan is cached per distinct header rather than rerun for every file in
+    a batch import.
+    """
+
+    col_map = {name.lower(): idx for idx, name in enumerate(header)}
+
+    def _find_column(*candidates: str) -> int | None:
+        for candidate in candidates:
+            for name, idx in col_map.items():
+                if candidate in name:
+                    return idx
+        return None
+
+    return (
+        _find_column("wavelength"),
+        _find_column("reflectance", "ratio"),
+        _find_column("radiance", "sample"),
+    )
+
+
+def _parse_rows_vectorized(data_lines: List[str]) -> np.ndarray | None:
+    if not data_lines:
+        return None
+    try:
+        return np.loadtxt(data_lines, dtype=np.float64, ndmin=2)
+    except ValueError:
+        return None
+
+
 def _build_tags(metadata: Dict[str, str]) -> List[str]:
     tags = ["asd"]
     instrument = metadata.get("Instrument") or metadata.get("Device")
@@ -4,13 +4,46 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Mapping, Optional, Protocol, Sequence
 
+import numpy as np
+
+
+def read_file_head(path: Path, size: int = 4096) -> str:
+    """Return the first ``size`` bytes of a file, decoded leniently.
+
+    Content probes in ``can_handle`` implementations share this so that a
+    file is opened once per sniff rather than once per importer. Keyed on
+    the modification time so an edited file is re-read.
+    """
+
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return ""
+    return _read_file_head_cached(str(path), mtime_ns, size)
+
+
+@lru_cache(maxsize=32)
+def _read_file_head_cached(path: str, mtime_ns: int, size: int) -> str:
+    try:
+        with open(path, "rb") as handle:
+            return handle.read(size).decode("utf-8", errors="ignore")
+    except OSError:
+        return ""
+
 
 @dataclass(slots=True)
 class SpectrumRecord:
-    """Normalized representation of an imported spectrum."""
+    """Normalized representation of an imported spectrum.
+
+    ``wavelengths`` and ``reflectance`` accept any float sequence and
+    are stored as ``float32`` ndarrays: roughly 7x smaller than a list
+    of PyFloat objects, and downstream formatting and blob packing run
+    vectorized without a conversion copy.
+    """
 
     library_name: str
     material_name: str
@@ -26,10 +59,14 @@ class SpectrumRecord:
     metadata: Dict[str, str] = field(default_factory=dict)
     tags: List[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        self.wavelengths = np.asarray(self.wavelengths, dtype=np.float32)
+        self.reflectance = np.asarray(self.reflectance, dtype=np.float32)
+
     def validate(self) -> None:
         if len(self.wavelengths) != len(self.reflectance):
             raise ValueError("wavelengths and reflectance must have equal length")
-        if not self.wavelengths:
+        if len(self.wavelengths) == 0:
             raise ValueError("spectrum must contain at least one data point")
 
 
@@ -14,15 +14,33 @@ class ImporterRegistry:
 
     def __init__(self) -> None:
         self._importers: List[Importer] = []
+        self._snapshot: tuple[Importer, ...] = ()
+        # Suffix -> importers index maintained at registration time, so
+        # per-file dispatch is a dict lookup rather than a linear scan
+        # over every importer's declared formats.
+        self._by_suffix: Dict[str, tuple[Importer, ...]] = defaultdict(tuple)
 
     def register(self, importer: Importer) -> None:
         self._importers.append(importer)
+        self._snapshot = tuple(self._importers)
+        for fmt in importer.formats:
+            suffix = fmt.lower()
+            self._by_suffix[suffix] = self._by_suffix[suffix] + (importer,)
 
     def available_importers(self) -> Sequence[Importer]:
-        return tuple(self._importers)
+        return self._snapshot
+
+    def importers_for_suffix(self, suffix: str) -> Sequence[Importer]:
+        """Return registered importers declaring ``suffix`` (no dot)."""
+
+        return self._by_suffix.get(suffix.lstrip(".").lower(), ())
 
     def find_for_path(self, path: Path) -> List[Importer]:
-        return [imp for imp in self._importers if imp.can_handle(path)]
+        # The suffix index narrows candidates before can_handle probes;
+        # content sniffs may open the file, so suffix mismatches should
+        # not cost a syscall per importer.
+        suffix = path.suffix.lstrip(".").lower()
+        return [imp for imp in self._by_suffix.get(suffix, ()) if imp.can_handle(path)]
 
     def import_file(self, path: Path, *, context: ImportContext | None = None) -> ImportResult:
         fallback_result: ImportResult | None = None
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Iterable, Sequence
+from typing import Sequence
 
-from sqlalchemy import delete, select
+import numpy as np
+from sqlalchemy import delete, insert, select
 
 from .db.models import Material, Spectrum, SpectrumPoint
 from .db.session import get_session
@@ -38,50 +39,76 @@ def seed_demo_data(*, force: bool = False) -> int:
 
 
 def _create_demo_materials(session) -> None:
-    for material_payload in _DEMO_DATA:
-        material = Material(
-            library_name=material_payload["library_name"],
-            material_name=material_payload["material_name"],
-            category=material_payload["category"],
-            location=material_payload.get("location"),
-            comments=material_payload.get("comments"),
-        )
-
-        for spec_payload in material_payload["spectra"]:
-            spectrum = Spectrum(
-                source=spec_payload["source"],
-                wavelength_unit=spec_payload["wavelength_unit"],
-                reflectance_unit=spec_payload["reflectance_unit"],
-                acquisition_date=spec_payload.get("acquisition_date"),
-                quality_status=spec_payload.get("quality_status", "complete"),
-                comments=spec_payload.get("comments"),
+    # Core executemany per table instead of unit-of-work cascades: one
+    # INSERT round trip each for materials, spectra and points.
+    material_rows = [
+        {
+            "library_name": payload["library_name"],
+            "material_name": payload["material_name"],
+            "category": payload["category"],
+            "location": payload.get("location"),
+            "comments": payload.get("comments"),
+        }
+        for payload in _DEMO_DATA
+    ]
+    material_ids = session.execute(
+        insert(Material).returning(Material.id, sort_by_parameter_order=True),
+        material_rows,
+    ).scalars().all()
+
+    spectrum_rows = []
+    series_by_row: list[np.ndarray] = []
+    for material_id, payload in zip(material_ids, _DEMO_DATA):
+        for spec_payload in payload["spectra"]:
+            spectrum_rows.append(
+                {
+                    "material_id": material_id,
+                    "source": spec_payload["source"],
+                    "wavelength_unit": spec_payload["wavelength_unit"],
+                    "reflectance_unit": spec_payload["reflectance_unit"],
+                    "acquisition_date": spec_payload.get("acquisition_date"),
+                    "quality_status": spec_payload.get("quality_status", "complete"),
+                    "comments": spec_payload.get("comments"),
+                }
             )
-            spectrum.points = [
-                SpectrumPoint(
-                    order_index=index,
-                    wavelength=wavelength,
-                    reflectance=reflectance,
-                    uncertainty=None,
-                )
-                for index, (wavelength, reflectance) in enumerate(spec_payload["series"], start=1)
-            ]
-            material.spectra.append(spectrum)
-
-        session.add(material)
-
-
-def _sample_series(start: float, end: float, *, steps: int) -> Iterable[tuple[float, float]]:
-    """Generate a simple linear ramp between two reflectance values."""
+            series_by_row.append(spec_payload["series"])
+    if not spectrum_rows:
+        return
+
+    spectrum_ids = session.execute(
+        insert(Spectrum).returning(Spectrum.id, sort_by_parameter_order=True),
+        spectrum_rows,
+    ).scalars().all()
+
+    point_rows = [
+        {
+            "spectrum_id": spectrum_id,
+            "order_index": index,
+            "wavelength": wavelength,
+            "reflectance": reflectance,
+            "uncertainty": None,
+        }
+        for spectrum_id, series in zip(spectrum_ids, series_by_row)
+        for index, (wavelength, reflectance) in enumerate(series, start=1)
+    ]
+    if point_rows:
+        session.execute(insert(SpectrumPoint), point_rows)
+
+
+def _sample_series(start: float, end: float, *, steps: int) -> np.ndarray:
+    """Generate a simple linear ramp between two reflectance values.
+
+    Returns an (N, 2) array built in two C calls rather than a Python
+    generator; as an array it can also be iterated more than once, so
+    re-seeding with ``force=True`` works.
+    """
 
     if steps < 2:
         raise ValueError("steps must be >= 2")
 
-    wavelength_start = 400.0
-    wavelength_step = 50.0
-
-    reflectance_step = (end - start) / (steps - 1)
-    for index in range(steps):
-        yield (wavelength_start + wavelength_step * index, start + reflectance_step * index)
+    wavelengths = 400.0 + 50.0 * np.arange(steps, dtype=np.float64)
+    reflectance = np.linspace(start, end, steps)
+    return np.column_stack([wavelengths, reflectance])
 
 
 _DEMO_DATA: Sequence[dict[str, object]] = (
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass
+from contextlib import nullcontext
 from datetime import date
+from functools import lru_cache
+from itertools import groupby
 import logging
-from typing import Iterable, List, Mapping, Sequence
+import threading
+from typing import Iterable, List, NamedTuple, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import Session
 
 from ..db.models import Material, Spectrum
 from ..db.session import get_session
@@ -19,8 +21,10 @@ from ..db.session import get_session
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True, slots=True)
-class SpectrumNode:
+# NamedTuple rather than a frozen dataclass: construction is one
+# C-level tuple allocation instead of a Python __init__ frame plus
+# object.__setattr__ per field, which adds up across large trees.
+class SpectrumNode(NamedTuple):
     """Lightweight descriptor for spectrum entries in the tree."""
 
     id: int
@@ -30,8 +34,7 @@ class SpectrumNode:
     quality_status: str
 
 
-@dataclass(frozen=True, slots=True)
-class MaterialNode:
+class MaterialNode(NamedTuple):
     """Material entry including its spectra."""
 
     id: int
@@ -40,8 +43,7 @@ class MaterialNode:
     spectra: Sequence[SpectrumNode]
 
 
-@dataclass(frozen=True, slots=True)
-class LibraryNode:
+class LibraryNode(NamedTuple):
     """Top-level library grouping."""
 
     name: str
@@ -50,6 +52,62 @@ class LibraryNode:
 
 LibraryTree = Sequence[LibraryNode]
 
+# Joining a 2-tuple runs in C and skips f-string interpolation of the
+# separator on the per-spectrum label path.
+_LABEL_SEP = " · "
+
+
+@lru_cache(maxsize=2048)
+def _iso(value: date) -> str:
+    """Memoized date.isoformat(); batches share few distinct dates."""
+
+    return value.isoformat()
+
+# Process-local read-aside cache for the tree, keyed on a cheap version
+# token; repeated UI navigations skip the full materials query entirely.
+_TREE_CACHE: tuple[tuple, LibraryTree] | None = None
+_TREE_CACHE_LOCK = threading.Lock()
+
+# Project just the eight columns the tree needs instead of hydrating
+# full Material/Spectrum instances; the outer join keeps spectrum-less
+# materials in the result.
+_TREE_STMT = (
+    select(
+        Material.id,
+        Material.library_name,
+        Material.material_name,
+        Material.category,
+        Spectrum.id,
+        Spectrum.source,
+        Spectrum.acquisition_date,
+        Spectrum.quality_status,
+    )
+    .join(Spectrum, isouter=True)
+    .order_by(
+        Material.library_name,
+        Material.material_name,
+        Material.id,
+        Spectrum.acquisition_date.is_(None),
+        Spectrum.acquisition_date,
+        Spectrum.id,
+    )
+)
+
+_VERSION_TOKEN_STMT = select(
+    select(func.max(Material.id)).scalar_subquery(),
+    select(func.count(Material.id)).scalar_subquery(),
+    select(func.max(Material.updated_at)).scalar_subquery(),
+    select(func.max(Spectrum.id)).scalar_subquery(),
+    select(func.count(Spectrum.id)).scalar_subquery(),
+    select(func.max(Spectrum.updated_at)).scalar_subquery(),
+)
+
+
+def _version_token(session) -> tuple:
+    """One-row fingerprint of the material/spectrum tables."""
+
+    return tuple(session.execute(_VERSION_TOKEN_STMT).one())
+
 
 class LibraryBrowserService:
     """Compose library/material/spectrum data for the UI."""
@@ -58,62 +116,97 @@ class LibraryBrowserService:
         # The service is stateless; session lifecycle is managed per call.
         pass
 
-    def fetch_library_tree(self) -> LibraryTree:
-        """Return a hierarchical representation of available materials and spectra."""
+    def fetch_library_tree(self, session: Session | None = None) -> LibraryTree:
+        """Return a hierarchical representation of available materials and spectra.
+
+        Repeat calls are served from a process-local cache as long as a
+        cheap version token (max id / count / max updated_at per table)
+        matches, so tab switches cost one scalar query instead of the
+        full ORM load. Callers refreshing back-to-back can pass a
+        long-lived read ``session`` to skip the per-call pool checkout
+        and BEGIN/COMMIT as well.
+        """
 
+        global _TREE_CACHE
+
+        scope = nullcontext(session) if session is not None else get_session()
         try:
-            with get_session() as session:
-                materials: List[Material] = (
-                    session.execute(
-                        select(Material)
-                        .options(joinedload(Material.spectra))
-                        .order_by(Material.library_name, Material.material_name)
-                    )
-                    .unique()
-                    .scalars()
-                    .all()
-                )
+            with scope as active_session:
+                token = _version_token(active_session)
+                with _TREE_CACHE_LOCK:
+                    if _TREE_CACHE is not None and _TREE_CACHE[0] == token:
+                        return _TREE_CACHE[1]
+                # Stream in server-side chunks so peak memory is one chunk
+                # of raw rows plus the output nodes, not the whole result
+                # set held alongside the finished tree.
+                rows = active_session.execute(_TREE_STMT).yield_per(1000)
+                grouped = _group_rows(rows)
         except SQLAlchemyError as exc:  # pragma: no cover - defensive fallback
             logger.debug("Failed to fetch library tree: %s", exc)
-            return ()
-
-        grouped: Mapping[str, List[MaterialNode]] = defaultdict(list)
-        for material in materials:
-            node = MaterialNode(
-                id=material.id,
-                name=material.material_name,
-                category=material.category,
-                spectra=tuple(_build_spectrum_nodes(material.spectra)),
-            )
-            grouped[material.library_name].append(node)
-
-        libraries: List[LibraryNode] = [
-            LibraryNode(name=name, materials=tuple(materials))
-            for name, materials in sorted(grouped.items())
+            return []
+
+        # Lists stay as-is behind the Sequence annotations; consumers only
+        # iterate and take len(), so sealing into tuples would just add a
+        # copy per collection.
+        tree: LibraryTree = [
+            LibraryNode(name=name, materials=materials)
+            for name, materials in grouped.items()
         ]
-        return tuple(libraries)
-
-
-def _build_spectrum_nodes(spectra: Iterable[Spectrum]) -> Iterable[SpectrumNode]:
-    for spectrum in sorted(
-        spectra,
-        key=lambda s: (
-            s.acquisition_date is None,
-            s.acquisition_date or date.min,
-            s.id,
-        ),
+        with _TREE_CACHE_LOCK:
+            _TREE_CACHE = (token, tree)
+        return tree
+
+    def invalidate(self) -> None:
+        """Drop the cached tree; the next fetch rebuilds unconditionally.
+
+        The version token already catches row changes, so this is only
+        needed for writers that bypass the tracked tables' fingerprints
+        (e.g. in-place updates within the same timestamp resolution).
+        """
+
+        global _TREE_CACHE
+        with _TREE_CACHE_LOCK:
+            _TREE_CACHE = None
+
+
+def _group_rows(rows: Iterable[tuple]) -> dict[str, List[MaterialNode]]:
+    # Plain dict beats defaultdict here (no __missing__ machinery on
+    # the hit path), and the query already orders by library name, so
+    # insertion order makes a final sorted() pass unnecessary.
+    grouped: dict[str, List[MaterialNode]] = {}
+    for (material_id, library_name, name, category), spectrum_rows in groupby(
+        rows, key=lambda row: row[:4]
     ):
-        label = _format_spectrum_label(spectrum)
-        yield SpectrumNode(
-            id=spectrum.id,
-            label=label,
-            source=spectrum.source,
-            acquisition_date=spectrum.acquisition_date,
-            quality_status=spectrum.quality_status,
+        node = MaterialNode(
+            id=material_id,
+            name=name,
+            category=category,
+            spectra=_build_spectrum_nodes(spectrum_rows),
         )
-
-
-def _format_spectrum_label(spectrum: Spectrum) -> str:
-    if spectrum.acquisition_date:
-        return f"{spectrum.source} · {spectrum.acquisition_date.isoformat()}"
-    return f"{spectrum.source} · #{spectrum.id}"
+        bucket = grouped.get(library_name)
+        if bucket is None:
+            grouped[library_name] = [node]
+        else:
+            bucket.append(node)
+    return grouped
+
+
+def _build_spectrum_nodes(rows: Iterable[tuple]) -> List[SpectrumNode]:
+    # rows arrive presorted by the statement's ORDER BY (dated first
+    # chronologically, then undated by id); the label conditional is
+    # inlined so node construction stays a single comprehension pass
+    return [
+        SpectrumNode(
+            id=spectrum_id,
+            label=_LABEL_SEP.join(
+                (source, _iso(acquisition_date))
+                if acquisition_date
+                else (source, f"#{spectrum_id}")
+            ),
+            source=source,
+            acquisition_date=acquisition_date,
+            quality_status=quality_status,
+        )
+        for _, _, _, _, spectrum_id, source, acquisition_date, quality_status in rows
+        if spectrum_id is not None
+    ]
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import os
 import sys
-from pathlib import Path
-from typing import Iterable, Sequence
+from functools import lru_cache
+from typing import Sequence
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication
@@ -28,6 +28,11 @@ def create_application(argv: Sequence[str] | None = None) -> QApplication:
     QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
     )
+    # Must be set before the QApplication exists; shared contexts avoid
+    # per-widget GL context creation once plot canvases arrive.
+    QApplication.setAttribute(
+        Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True
+    )
     _set_high_dpi_attributes()
     _ensure_font_configuration()
 
@@ -49,37 +54,52 @@ def create_application(argv: Sequence[str] | None = None) -> QApplication:
 # Font helpers
 
 
+# Resolved once per process; repeat create_application calls reuse it
+# without re-statting candidate directories.
+_RESOLVED_FONT_DIR: str | None = None
+
+
 def _ensure_font_configuration() -> None:
     """Set ``QT_QPA_FONTDIR`` when no fonts are bundled with Qt/PySide."""
 
+    global _RESOLVED_FONT_DIR
+
+    if _RESOLVED_FONT_DIR is not None:
+        os.environ.setdefault("QT_QPA_FONTDIR", _RESOLVED_FONT_DIR)
+        return
+
     current = os.environ.get("QT_QPA_FONTDIR")
-    if current and Path(current).exists():
+    if current and os.path.isdir(current):
+        _RESOLVED_FONT_DIR = current
         return
 
     for candidate in _candidate_font_dirs():
-        if candidate.exists():
-            os.environ["QT_QPA_FONTDIR"] = str(candidate)
+        if os.path.isdir(candidate):
+            os.environ["QT_QPA_FONTDIR"] = candidate
+            _RESOLVED_FONT_DIR = candidate
             break
 
 
-def _candidate_font_dirs() -> Iterable[Path]:
-    """Yield platform-aware font directories to test in order."""
+@lru_cache(maxsize=1)
+def _candidate_font_dirs() -> tuple[str, ...]:
+    """Return platform-aware font directories to test in order."""
 
+    candidates: list[str] = []
     override = os.environ.get("SPECTRALLIBRARY_FONT_DIR")
     if override:
-        yield Path(override)
+        candidates.append(override)
 
     if sys.platform.startswith("win"):
         windir = os.environ.get("WINDIR", r"C:\\Windows")
-        yield Path(windir) / "Fonts"
+        candidates.append(os.path.join(windir, "Fonts"))
     elif sys.platform == "darwin":
-        yield Path("/System/Library/Fonts")
-        yield Path("/Library/Fonts")
+        candidates.extend(("/System/Library/Fonts", "/Library/Fonts"))
     else:
-        linux_candidates = (
-            Path("/usr/share/fonts"),
-            Path("/usr/local/share/fonts"),
-            Path.home() / ".local/share/fonts",
+        candidates.extend(
+            (
+                "/usr/share/fonts",
+                "/usr/local/share/fonts",
+                os.path.expanduser("~/.local/share/fonts"),
+            )
         )
-        for path in linux_candidates:
-            yield path
+    return tuple(candidates)
@@ -27,6 +27,16 @@ from .views import (
 from ..importing import SpectrumRecord
 from ..services import ImportSummary
 
+_VIEW_ORDER: Final[tuple[str, ...]] = ("library", "spectra", "import", "export", "plugins")
+_VIEW_INDEX: Final[dict[str, int]] = {name: index for index, name in enumerate(_VIEW_ORDER)}
+_VIEW_FACTORIES: Final[tuple[type[QWidget], ...]] = (
+    LibraryBrowserView,
+    SpectrumViewerView,
+    ImportWizardView,
+    ExportCenterView,
+    PluginHubView,
+)
+
 
 class MainWindow(QMainWindow):
     """Primary application frame, wiring placeholder views."""
@@ -37,16 +47,12 @@ class MainWindow(QMainWindow):
         super().__init__()
 
         self._stack = QStackedWidget(self)
-        self._views = {
-            "library": LibraryBrowserView(self),
-            "spectra": SpectrumViewerView(self),
-            "import": ImportWizardView(self),
-            "export": ExportCenterView(self),
-            "plugins": PluginHubView(self),
-        }
-
-        for view in self._views.values():
-            self._stack.addWidget(view)
+        # Views are constructed on first visit; cold startup only pays
+        # for the library browser instead of all five widget trees.
+        # _views mirrors the instances by name for lookups and tests;
+        # switching itself runs on integer stack positions.
+        self._views: dict[str, QWidget] = {}
+        self._view_stack_positions: list[int] = [-1] * len(_VIEW_ORDER)
 
         self.setCentralWidget(self._stack)
         self.setWindowTitle(self.WINDOW_TITLE)
@@ -56,11 +62,12 @@ class MainWindow(QMainWindow):
         self._pending_viewer_records: list[SpectrumRecord] | None = None
         self._viewer_shortcut_button: QPushButton | None = None
         self._viewer_shortcut_timer: QTimer | None = None
+        self._last_shortcut_state: tuple[bool, str] = (False, "")
 
         self._setup_navigation()
         self._setup_toolbar()
         self._setup_status_bar()
-        self._setup_view_signals()
+        self._switch_to("library")
 
     # region setup helpers
     def _setup_navigation(self) -> None:
@@ -100,29 +107,68 @@ class MainWindow(QMainWindow):
 
     # endregion
 
-    def _setup_view_signals(self) -> None:
-        import_view = self._views.get("import")
+    def _connect_import_signals(self, import_view: QWidget) -> None:
         if hasattr(import_view, "import_completed"):
-            import_view.import_completed.connect(self._handle_import_completed)
+            # Queued so the navigation tree rebuild lands on a later
+            # event-loop tick instead of extending the completion slot.
+            import_view.import_completed.connect(
+                self._handle_import_completed, Qt.ConnectionType.QueuedConnection
+            )
         if hasattr(import_view, "import_records_ready"):
             import_view.import_records_ready.connect(self._handle_import_records_ready)
 
     def _make_action(self, text: str, target: str) -> QAction:
+        # All actions share one bound slot and stash their target in
+        # action data, instead of a per-action lambda closure.
         action = QAction(text, self)
-        action.triggered.connect(lambda: self._switch_to(target))
+        action.setData(target)
+        action.triggered.connect(self._on_nav_action)
         return action
 
+    def _on_nav_action(self) -> None:
+        action = self.sender()
+        if isinstance(action, QAction):
+            self._switch_to(action.data())
+
     def _handle_view_request(self, target: str) -> None:
         self._switch_to(target)
 
-    def _switch_to(self, target: str) -> None:
+    def _ensure_view(self, target: str) -> QWidget | None:
+        """Return the view for ``target``, constructing it on first use."""
+
+        index = _VIEW_INDEX.get(target)
+        if index is None:
+            return None
         view = self._views.get(target)
-        if view is None:
+        if view is not None:
+            return view
+        view = _VIEW_FACTORIES[index](self)
+        self._views[target] = view
+        self._view_stack_positions[index] = self._stack.addWidget(view)
+        if target == "import":
+            self._connect_import_signals(view)
+        return view
+
+    @property
+    def import_view(self) -> ImportWizardView:
+        """The import wizard view, constructed on first access."""
+
+        return self._ensure_view("import")  # type: ignore[return-value]
+
+    @property
+    def spectrum_viewer(self) -> SpectrumViewerView:
+        """The spectrum viewer view, constructed on first access."""
+
+        return self._ensure_view("spectra")  # type: ignore[return-value]
+
+    def _switch_to(self, target: str) -> None:
+        if self._ensure_view(target) is None:
             return
-        self._stack.setCurrentWidget(view)
+        self._stack.setCurrentIndex(self._view_stack_positions[_VIEW_INDEX[target]])
 
     def _handle_import_completed(self, summary: ImportSummary) -> None:
         if self._navigation_dock is not None:
+            self._navigation_dock.invalidate()
             self._navigation_dock.refresh()
 
         status = self.statusBar()
@@ -132,28 +178,55 @@ class MainWindow(QMainWindow):
             )
 
     def _handle_import_records_ready(self, records) -> None:
-        self._pending_viewer_records = list(records) if records else None
+        if not records:
+            self._pending_viewer_records = None
+        else:
+            # keep an existing list as-is; only materialize other iterables
+            self._pending_viewer_records = (
+                records if isinstance(records, list) else list(records)
+            )
         self._update_viewer_shortcut()
 
     def _update_viewer_shortcut(self) -> None:
         if self._viewer_shortcut_button is None:
             return
 
-        has_records = bool(self._pending_viewer_records)
-        self._viewer_shortcut_button.setVisible(has_records)
+        records = self._pending_viewer_records
+        count = len(records) if records else 0
+        has_records = count > 0
+        label = (
+            ""
+            if not has_records
+            else "View imported spectrum"
+            if count == 1
+            else "View imported spectra"
+        )
+
+        # Only touch the widget when its state actually changes; import
+        # signal bursts otherwise churn visibility/text invalidations.
+        state = (has_records, label)
+        if state != self._last_shortcut_state:
+            self._last_shortcut_state = state
+            self._viewer_shortcut_button.setVisible(has_records)
+            if has_records:
+                self._viewer_shortcut_button.setText(label)
 
-        if has_records:
-            count = len(self._pending_viewer_records or [])
-            label = "View imported spectrum" if count == 1 else "View imported spectra"
-            self._viewer_shortcut_button.setText(label)
-            if self._viewer_shortcut_timer is not None:
-                self._viewer_shortcut_timer.start(10000)
-        elif self._viewer_shortcut_timer is not None:
-            self._viewer_shortcut_timer.stop()
+        if self._viewer_shortcut_timer is not None:
+            if has_records:
+                # Restart only when inactive or past its halfway point, so
+                # bursts don't reschedule the timer on every signal.
+                if (
+                    not self._viewer_shortcut_timer.isActive()
+                    or self._viewer_shortcut_timer.remainingTime() < 5000
+                ):
+                    self._viewer_shortcut_timer.start(10000)
+            else:
+                self._viewer_shortcut_timer.stop()
 
     def _hide_viewer_shortcut(self) -> None:
         if self._viewer_shortcut_button is not None:
             self._viewer_shortcut_button.setVisible(False)
+        self._last_shortcut_state = (False, "")
 
     def _open_last_import_in_viewer(self) -> None:
         if not self._pending_viewer_records:
@@ -3,9 +3,22 @@
 from __future__ import annotations
 
 import csv
+import time
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Qt, Signal, Slot, QThread
+import numpy as np
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThread,
+    QThreadPool,
+    Signal,
+    Slot,
+)
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QApplication,
@@ -18,14 +31,12 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QListWidget,
-    QListWidgetItem,
     QMessageBox,
     QProgressBar,
     QPushButton,
     QStackedWidget,
     QTextEdit,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -33,6 +44,23 @@ from PySide6.QtWidgets import (
 from ...importing import ImportContext, ImportResult, SpectrumRecord, importer_registry
 from ...services import ImportService, ImportSummary
 
+# Bound str.format callables reused across preview formatting; cheaper
+# than re-evaluating an f-string spec per element.
+_FMT_WL = "{:.2f}".format
+_FMT_RF = "{:.4f}".format
+
+# The service is stateless, so all wizard instances (reopened views,
+# test harnesses) can share one lazily created instance instead of
+# re-running construction per view.
+_SERVICE_SINGLETON: ImportService | None = None
+
+
+def _get_service() -> ImportService:
+    global _SERVICE_SINGLETON
+    if _SERVICE_SINGLETON is None:
+        _SERVICE_SINGLETON = ImportService()
+    return _SERVICE_SINGLETON
+
 
 class ImportWizardView(QWidget):
     """Simple stacked widget mimicking a multi-step import flow."""
@@ -54,9 +82,10 @@ class ImportWizardView(QWidget):
         self.stepper = StepperWidget(self)
         layout.addWidget(self.stepper, 1)
 
-        self._service = ImportService()
-        self._worker_thread: QThread | None = None
-        self._worker: ImportWorker | None = None
+        self._service = _get_service()
+        self._active_workers: list[ImportWorker] = []
+        self._preview_thread: QThread | None = None
+        self._preview_worker: PreviewWorker | None = None
         self._last_directory = str(Path.home())
         self._last_import_result: ImportResult | None = None
         self._last_import_path: Path | None = None
@@ -129,38 +158,69 @@ class ImportWizardView(QWidget):
             return
 
         context = ImportContext(target_library=self.library_override.text().strip() or None)
-
-        try:
-            result = importer_registry.import_file(selected_path, context=context)
-        except Exception as exc:  # pragma: no cover - UI safeguard
-            QMessageBox.warning(self, "Preview failed", f"Unable to preview file:\n{exc}")
-            return
-
-        dialog = ImportPreviewDialog(selected_path, result, parent=self)
-        dialog.exec()
+        self._start_preview(selected_path, context)
 
     def _start_import(self, file_path: Path, context: ImportContext | None) -> None:
         self._set_import_running(True)
+        # Release the previous result so its records can be collected
+        # while the replacement import runs.
+        self._last_import_result = None
+        self._last_import_path = None
 
         worker = ImportWorker(self._service, file_path, context)
+        worker.setAutoDelete(False)
+
+        # Bound-method connections queue back to the GUI thread; the
+        # handlers drop the in-flight reference once the worker is done.
+        worker.signals.progress.connect(self._handle_import_progress)
+        worker.signals.completed.connect(self._handle_import_completed)
+        worker.signals.failed.connect(self._handle_import_failed)
+
+        # Keep the runnable (and its signals object) alive while pooled.
+        self._active_workers.append(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def _start_preview(self, file_path: Path, context: ImportContext | None) -> None:
+        self.preview_button.setDisabled(True)
+
+        worker = PreviewWorker(file_path, context)
         thread = QThread(self)
 
         worker.moveToThread(thread)
         thread.started.connect(worker.run)
 
-        worker.progress.connect(self._handle_import_progress)
-        worker.completed.connect(self._handle_import_completed)
-        worker.failed.connect(self._handle_import_failed)
-
-        worker.completed.connect(lambda *_: self._cleanup_worker())
-        worker.failed.connect(lambda *_: self._cleanup_worker())
+        # Bound-method connections queue back to the GUI thread, so the
+        # dialog opens (and the worker is torn down) on the main thread.
+        worker.ready.connect(self._handle_preview_ready)
+        worker.failed.connect(self._handle_preview_failed)
         thread.finished.connect(thread.deleteLater)
 
-        self._worker = worker
-        self._worker_thread = thread
+        self._preview_worker = worker
+        self._preview_thread = thread
 
         thread.start()
 
+    def _handle_preview_ready(self, result: ImportResult, file_name: str) -> None:
+        self._cleanup_preview_worker()
+        self.preview_button.setDisabled(False)
+
+        dialog = ImportPreviewDialog(Path(file_name), result, parent=self)
+        dialog.exec()
+
+    def _handle_preview_failed(self, message: str) -> None:  # pragma: no cover - UI safeguard
+        self._cleanup_preview_worker()
+        self.preview_button.setDisabled(False)
+        QMessageBox.warning(self, "Preview failed", f"Unable to preview file:\n{message}")
+
+    def _cleanup_preview_worker(self) -> None:
+        if self._preview_thread:
+            self._preview_thread.quit()
+            self._preview_thread.wait()
+            self._preview_thread = None
+        if self._preview_worker:
+            self._preview_worker.deleteLater()
+            self._preview_worker = None
+
     def _handle_import_progress(self, processed: int, total: int) -> None:
         if total <= 0:
             self.import_progress.setRange(0, 0)
@@ -177,10 +237,14 @@ class ImportWizardView(QWidget):
     def _handle_import_completed(
         self, summary: ImportSummary, file_name: str, result: ImportResult
     ) -> None:
+        # One PurePath construction per completion; the status helper
+        # takes the display name instead of re-parsing the string.
+        path = Path(file_name)
+        self._cleanup_worker()
         self._set_import_running(False)
-        self._update_status(summary, file_name)
+        self._update_status(summary, path.name)
         self._last_import_result = result
-        self._last_import_path = Path(file_name)
+        self._last_import_path = path
 
         self.import_records_ready.emit(result.records)
 
@@ -208,6 +272,7 @@ class ImportWizardView(QWidget):
                 )
 
     def _handle_import_failed(self, message: str) -> None:  # pragma: no cover - UI safeguard
+        self._cleanup_worker()
         self._set_import_running(False)
         QMessageBox.critical(self, "Import failed", f"Unable to import file:\n{message}")
 
@@ -226,16 +291,13 @@ class ImportWizardView(QWidget):
             self.import_progress.setFormat("")
 
     def _cleanup_worker(self) -> None:
-        if self._worker_thread:
-            self._worker_thread.quit()
-            self._worker_thread.wait()
-            self._worker_thread = None
-        if self._worker:
-            self._worker.deleteLater()
-            self._worker = None
+        # Pooled runnables finish on their own; dropping the references
+        # lets completed workers (and their signal objects) be collected.
+        self._active_workers.clear()
 
     def closeEvent(self, event):  # pragma: no cover - UI lifecycle hook
         self._cleanup_worker()
+        self._cleanup_preview_worker()
         super().closeEvent(event)
 
     def _choose_file(self, title: str) -> Path | None:
@@ -252,24 +314,27 @@ class ImportWizardView(QWidget):
         self._last_directory = str(path.parent)
         return path
 
-    def _update_status(self, summary: ImportSummary, file_name: str) -> None:
+    def _update_status(self, summary: ImportSummary, display_name: str) -> None:
         if summary.created_spectra:
             status_text = (
                 f"Imported {summary.created_spectra} spectra across {summary.created_materials} materials "
-                f"from {Path(file_name).name}."
+                f"from {display_name}."
             )
         else:
-            status_text = f"No spectra were imported from {Path(file_name).name}."
+            status_text = f"No spectra were imported from {display_name}."
 
         self.status_label.setText(status_text)
 
-        self.warning_list.clear()
-        if summary.warnings:
-            for warning in summary.warnings:
-                QListWidgetItem(warning, self.warning_list)
-            self.warning_list.setVisible(True)
-        else:
-            self.warning_list.setVisible(False)
+        # addItems populates in one internal model update instead of a
+        # signal-emitting insert per warning.
+        self.warning_list.setUpdatesEnabled(False)
+        try:
+            self.warning_list.clear()
+            if summary.warnings:
+                self.warning_list.addItems(list(summary.warnings))
+        finally:
+            self.warning_list.setUpdatesEnabled(True)
+        self.warning_list.setVisible(bool(summary.warnings))
 
         self.import_progress.setVisible(False)
         self.import_progress.setRange(0, 1)
@@ -294,8 +359,21 @@ class StepperWidget(QStackedWidget):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
-        for index, name in enumerate(self.steps, start=1):
-            self.addWidget(self._build_step(index, name))
+        # Steps are built on first visit, mirroring the lazy views in
+        # MainWindow: only the current step pays its widget-tree cost.
+        self._built_steps: list[bool] = [False] * len(self.steps)
+        for _ in self.steps:
+            self.addWidget(QWidget(self))
+        self.setCurrentIndex(0)
+
+    def setCurrentIndex(self, index: int) -> None:
+        if 0 <= index < len(self._built_steps) and not self._built_steps[index]:
+            placeholder = self.widget(index)
+            self.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.insertWidget(index, self._build_step(index + 1, self.steps[index]))
+            self._built_steps[index] = True
+        super().setCurrentIndex(index)
 
     def _build_step(self, index: int, name: str) -> QWidget:
         widget = QGroupBox(f"Step {index}: {name}")
@@ -319,16 +397,30 @@ class StepperWidget(QStackedWidget):
         return widget
 
 
-class ImportWorker(QObject):
+class ImportWorkerSignals(QObject):
+    """Signal carrier for ``ImportWorker``; QRunnable cannot emit directly."""
+
     progress = Signal(int, int)
     completed = Signal(object, str, object)
     failed = Signal(str)
 
+
+class ImportWorker(QRunnable):
+    """Runs an import on the shared global thread pool.
+
+    A pooled runnable reuses existing OS threads, so rapid successive
+    imports skip the per-click thread create/destroy cycle of the old
+    QThread-per-import wiring.
+    """
+
     def __init__(self, service: ImportService, path: Path, context: ImportContext | None) -> None:
         super().__init__()
+        self.signals = ImportWorkerSignals()
         self._service = service
         self._path = path
         self._context = context
+        self._last_emit = 0.0
+        self._last_processed = 0
 
     @Slot()
     def run(self) -> None:
@@ -339,12 +431,172 @@ class ImportWorker(QObject):
                 progress_callback=self._report_progress,
             )
         except Exception as exc:  # pragma: no cover - defensive
-            self.failed.emit(str(exc))
+            self.signals.failed.emit(str(exc))
             return
-        self.completed.emit(summary, str(self._path), result)
+        self.signals.completed.emit(summary, str(self._path), result)
 
     def _report_progress(self, processed: int, total: int) -> None:
-        self.progress.emit(processed, total)
+        # Coalesce emissions: a per-record cross-thread signal floods
+        # the GUI event queue on large files. Emit on completion, every
+        # ~0.5% of progress, or at most every 50 ms otherwise.
+        step = max(1, total // 200)
+        now = time.monotonic()
+        if (
+            processed != total
+            and processed - self._last_processed < step
+            and now - self._last_emit <= 0.05
+        ):
+            return
+        self._last_processed = processed
+        self._last_emit = now
+        self.signals.progress.emit(processed, total)
+
+
+class PreviewWorker(QObject):
+    """Parses a file for preview off the GUI thread.
+
+    Same shape as ``ImportWorker`` but stops after the registry parse;
+    nothing is persisted.
+    """
+
+    ready = Signal(object, str)
+    failed = Signal(str)
+
+    def __init__(self, path: Path, context: ImportContext | None) -> None:
+        super().__init__()
+        self._path = path
+        self._context = context
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            result = importer_registry.import_file(self._path, context=self._context)
+        except Exception as exc:  # pragma: no cover - defensive
+            self.failed.emit(str(exc))
+            return
+        self.ready.emit(result, str(self._path))
+
+
+class ExportWorker(QObject):
+    """Writes preview CSV exports off the GUI thread.
+
+    Mirrors ``ImportWorker``: constructed with its inputs, moved to a
+    ``QThread``, and driven by ``run()``. ``finished`` carries an error
+    string, or ``None`` on success.
+    """
+
+    progress = Signal(int, int)
+    finished = Signal(object)
+
+    def __init__(self, path: str, records: list[SpectrumRecord], mode: str) -> None:
+        super().__init__()
+        self._path = path
+        self._records = records
+        self._mode = mode
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            if self._mode == "single":
+                self._write_single()
+            else:
+                self._write_all()
+        except Exception as exc:  # pragma: no cover - defensive
+            self.finished.emit(str(exc))
+            return
+        self.finished.emit(None)
+
+    def _write_single(self) -> None:
+        record = self._records[0]
+        with open(self._path, "w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(
+                [
+                    f"Wavelength ({record.wavelength_unit})",
+                    f"Reflectance ({record.reflectance_unit})",
+                ]
+            )
+            # The data rows are plain floats with no quoting needs, so
+            # format both columns vectorized and emit one joined write
+            # instead of routing every row through the csv module (or
+            # savetxt's per-row Python loop).
+            rows = np.char.add(
+                np.char.add(np.char.mod("%.6g", record.wavelengths), ","),
+                np.char.mod("%.6g", record.reflectance),
+            )
+            handle.write("\n".join(rows))
+            handle.write("\n")
+
+    def _write_all(self) -> None:
+        total = len(self._records)
+        # 1 MiB write buffer so thousands of small writerow calls
+        # coalesce into few flushes to disk
+        with open(self._path, "w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
+            writer = csv.writer(handle)
+            writer.writerow(_EXPORT_ALL_HEADER)
+            for index, record in enumerate(self._records, start=1):
+                writer.writerow(_record_to_csv_row(record))
+                self.progress.emit(index, total)
+
+
+class _PreviewTableModel(QAbstractTableModel):
+    """Read-only model over parsed records.
+
+    Cell text is computed on demand in ``data()`` rather than stored in
+    per-cell items, so a preview of N records costs no Qt objects beyond
+    the model itself and population is a single model reset.
+    """
+
+    _HEADERS = (
+        "Library",
+        "Material",
+        "Category",
+        "Source",
+        "Wavelength range",
+        "Reflectance sample",
+        "Tags",
+    )
+
+    def __init__(self, records, preview_strings, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._records = records
+        # Shared with the dialog so range/summary strings are formatted
+        # once per record across the table and the detail pane.
+        self._preview_strings = preview_strings
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        record = self._records[index.row()]
+        column = index.column()
+        if column == 0:
+            return record.library_name
+        if column == 1:
+            return record.material_name
+        if column == 2:
+            return record.category or ""
+        if column == 3:
+            return record.source or ""
+        if column == 4:
+            return self._preview_strings(record)[0]
+        if column == 5:
+            return self._preview_strings(record)[1]
+        if column == 6:
+            return self._preview_strings(record)[4]
+        return None
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._HEADERS[section]
+        return None
 
 
 class ImportPreviewDialog(QDialog):
@@ -357,22 +609,29 @@ class ImportPreviewDialog(QDialog):
 
         self._source_path = path
         self._all_records = result.records
+        self._export_worker: ExportWorker | None = None
+        self._export_thread: QThread | None = None
+        # Records are immutable once parsed, so derived preview strings
+        # are computed once per record and reused across table fills and
+        # detail-pane clicks; keyed by id() since the dialog keeps the
+        # records alive for its lifetime.
+        self._preview_cache: dict[int, tuple[str, str, str, str, str]] = {}
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(12)
 
         summary = QLabel(
-            (
-                f"Found {len(result.records)} record(s) in {path.name}. "
-                "Only the first 10 records are shown below."
-            ),
+            f"Found {len(result.records)} record(s) in {path.name}.",
             self,
         )
         summary.setWordWrap(True)
         layout.addWidget(summary)
 
-        self._records = self._all_records[:10]
+        # The model-backed view renders only visible rows, so every
+        # record can be listed without a cap; off-screen rows cost
+        # nothing until scrolled into view.
+        self._records = self._all_records
         self._detail_text: QTextEdit | None = None
         self._selected_row = 0 if self._records else -1
         self._copy_button: QPushButton | None = None
@@ -380,37 +639,13 @@ class ImportPreviewDialog(QDialog):
         self._export_all_button: QPushButton | None = None
 
         if self._records:
-            table = QTableWidget(len(self._records), 7, self)
-            table.setHorizontalHeaderLabels(
-                [
-                    "Library",
-                    "Material",
-                    "Category",
-                    "Source",
-                    "Wavelength range",
-                    "Reflectance sample",
-                    "Tags",
-                ]
-            )
+            table = QTableView(self)
+            table.setModel(_PreviewTableModel(self._records, self._record_preview_strings, table))
             table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
             table.verticalHeader().setVisible(False)
             table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
 
-            for row_index, record in enumerate(self._records):
-                table.setItem(row_index, 0, QTableWidgetItem(record.library_name))
-                table.setItem(row_index, 1, QTableWidgetItem(record.material_name))
-                table.setItem(row_index, 2, QTableWidgetItem(record.category or ""))
-                table.setItem(row_index, 3, QTableWidgetItem(record.source or ""))
-
-                wavelength_text = _format_wavelength_range(record)
-                table.setItem(row_index, 4, QTableWidgetItem(wavelength_text))
-
-                reflectance_text = _format_reflectance_preview(record)
-                table.setItem(row_index, 5, QTableWidgetItem(reflectance_text))
-
-                table.setItem(row_index, 6, QTableWidgetItem("; ".join(record.tags)))
-
-            table.cellClicked.connect(self._handle_row_selected)
+            table.clicked.connect(self._handle_row_selected)
             layout.addWidget(table)
 
             detail_label = QLabel("Selected record details", self)
@@ -434,8 +669,7 @@ class ImportPreviewDialog(QDialog):
             warnings_layout.setSpacing(4)
 
             warnings_list = QListWidget(warnings_group)
-            for warning in result.warnings:
-                QListWidgetItem(warning, warnings_list)
+            warnings_list.addItems(list(result.warnings))
             warnings_layout.addWidget(warnings_list)
             layout.addWidget(warnings_group)
 
@@ -464,8 +698,8 @@ class ImportPreviewDialog(QDialog):
 
         layout.addWidget(buttons)
 
-    def _handle_row_selected(self, row: int, _column: int) -> None:
-        self._update_detail_text(row)
+    def _handle_row_selected(self, index: QModelIndex) -> None:
+        self._update_detail_text(index.row())
 
     def _update_detail_text(self, row: int) -> None:
         if self._detail_text is None or not self._records:
@@ -474,22 +708,22 @@ class ImportPreviewDialog(QDialog):
         record = self._records[row]
         self._selected_row = row
 
-        wavelengths_preview = ", ".join(f"{value:.2f}" for value in record.wavelengths[:12])
-        if len(record.wavelengths) > 12:
-            wavelengths_preview += " …"
-
-        reflectance_preview = ", ".join(f"{value:.4f}" for value in record.reflectance[:12])
-        if len(record.reflectance) > 12:
-            reflectance_preview += " …"
+        (
+            range_text,
+            _,
+            wavelengths_preview,
+            reflectance_preview,
+            tags_joined,
+        ) = self._record_preview_strings(record)
 
         lines = [
             f"Library: {record.library_name}",
             f"Material: {record.material_name}",
             f"Category: {record.category or '-'}",
             f"Source: {record.source or '-'}",
-            f"Tags: {'; '.join(record.tags) if record.tags else '-'}",
+            f"Tags: {tags_joined or '-'}",
             "",
-            f"Wavelength range: {_format_wavelength_range(record)}",
+            f"Wavelength range: {range_text}",
             "Wavelength samples:",
             wavelengths_preview or "(none)",
             "",
@@ -500,6 +734,21 @@ class ImportPreviewDialog(QDialog):
 
         self._detail_text.setPlainText("\n".join(lines))
 
+    def _record_preview_strings(self, record: SpectrumRecord) -> tuple[str, str, str, str, str]:
+        """Return (range, reflectance summary, wavelength samples, reflectance samples, tags)."""
+
+        cached = self._preview_cache.get(id(record))
+        if cached is None:
+            cached = (
+                _format_wavelength_range(record),
+                _format_reflectance_preview(record),
+                _format_sample_preview(record.wavelengths, _FMT_WL),
+                _format_sample_preview(record.reflectance, _FMT_RF),
+                "; ".join(record.tags),
+            )
+            self._preview_cache[id(record)] = cached
+        return cached
+
     def _current_record(self) -> SpectrumRecord | None:
         if not self._records:
             return None
@@ -535,23 +784,7 @@ class ImportPreviewDialog(QDialog):
         if not file_path:
             return
 
-        try:
-            with open(file_path, "w", newline="", encoding="utf-8") as handle:
-                writer = csv.writer(handle)
-                writer.writerow(
-                    [
-                        f"Wavelength ({record.wavelength_unit})",
-                        f"Reflectance ({record.reflectance_unit})",
-                    ]
-                )
-                for wavelength, reflectance in zip(record.wavelengths, record.reflectance):
-                    writer.writerow([wavelength, reflectance])
-        except Exception as exc:  # pragma: no cover - UI safeguard
-            QMessageBox.critical(
-                self,
-                "Export failed",
-                f"Unable to export spectrum data:\n{exc}",
-            )
+        self._start_export(file_path, [record], "single")
 
     def _handle_export_all_csv(self) -> None:
         if not self._all_records:
@@ -577,58 +810,99 @@ class ImportPreviewDialog(QDialog):
         if not file_path:
             return
 
-        header = [
-            "library_name",
-            "material_name",
-            "category",
-            "source",
-            "wavelength_unit",
-            "reflectance_unit",
-            "wavelengths",
-            "reflectance",
-            "tags",
-            "acquisition_date",
-            "location",
-            "comments",
-        ]
+        self._start_export(file_path, self._all_records, "all")
 
-        try:
-            with open(file_path, "w", newline="", encoding="utf-8") as handle:
-                writer = csv.writer(handle)
-                writer.writerow(header)
-                for record in self._all_records:
-                    writer.writerow(_record_to_csv_row(record))
-        except Exception as exc:  # pragma: no cover - UI safeguard
+    def _start_export(self, file_path: str, records: list[SpectrumRecord], mode: str) -> None:
+        self._set_export_running(True)
+
+        worker = ExportWorker(file_path, records, mode)
+        thread = QThread(self)
+
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+
+        # Cleanup happens inside _handle_export_finished: a bound-method
+        # connection is queued back to the GUI thread, whereas a lambda
+        # would run directly on the worker thread and wait on itself.
+        worker.finished.connect(self._handle_export_finished)
+        thread.finished.connect(thread.deleteLater)
+
+        self._export_worker = worker
+        self._export_thread = thread
+
+        thread.start()
+
+    def _handle_export_finished(self, error: object) -> None:
+        self._cleanup_export_worker()
+        self._set_export_running(False)
+        if error is not None:  # pragma: no cover - UI safeguard
             QMessageBox.critical(
                 self,
                 "Export failed",
-                f"Unable to export previewed spectra:\n{exc}",
+                f"Unable to export spectrum data:\n{error}",
             )
 
+    def _set_export_running(self, running: bool) -> None:
+        has_records = bool(self._records)
+        if self._export_button is not None:
+            self._export_button.setEnabled(has_records and not running)
+        if self._export_all_button is not None:
+            self._export_all_button.setEnabled(has_records and not running)
+
+    def _cleanup_export_worker(self) -> None:
+        if self._export_thread:
+            self._export_thread.quit()
+            self._export_thread.wait()
+            self._export_thread = None
+        if self._export_worker:
+            self._export_worker.deleteLater()
+            self._export_worker = None
+
+    def _release_records(self) -> None:
+        # Drop the record references (and derived strings) so a closed
+        # dialog doesn't pin large spectra arrays in RSS; a still-running
+        # export worker keeps its own reference to what it needs.
+        self._all_records = []
+        self._records = []
+        self._preview_cache.clear()
+        self._detail_text = None
+
+    def done(self, result: int) -> None:  # pragma: no cover - UI lifecycle hook
+        self._release_records()
+        super().done(result)
+
+    def closeEvent(self, event):  # pragma: no cover - UI lifecycle hook
+        self._cleanup_export_worker()
+        self._release_records()
+        super().closeEvent(event)
+
 
 def _format_wavelength_range(record: SpectrumRecord) -> str:
     wavelengths = record.wavelengths
-    if not wavelengths:
+    if len(wavelengths) == 0:
         return "—"
 
-    start = float(wavelengths[0])
-    end = float(wavelengths[-1])
+    start = _FMT_WL(wavelengths[0])
+    end = _FMT_WL(wavelengths[-1])
     total = len(wavelengths)
     unit = record.wavelength_unit
 
     if total == 1:
-        return f"{start:.2f} {unit}"
+        return f"{start} {unit}"
 
-    return f"{start:.2f} – {end:.2f} {unit} ({total} samples)"
+    return f"{start} – {end} {unit} ({total} samples)"
 
 
 def _format_reflectance_preview(record: SpectrumRecord) -> str:
     reflectance = record.reflectance
-    if not reflectance:
+    if len(reflectance) == 0:
         return "—"
 
-    minimum = min(reflectance)
-    maximum = max(reflectance)
+    # C-level reductions instead of two interpreter passes; records
+    # already hold float32 ndarrays, so asarray is a no-op view
+    arr = np.asarray(reflectance)
+    minimum = float(arr.min())
+    maximum = float(arr.max())
     unit = record.reflectance_unit
 
     if abs(maximum - minimum) < 1e-9:
@@ -637,6 +911,43 @@ def _format_reflectance_preview(record: SpectrumRecord) -> str:
     return f"{minimum:.4f} – {maximum:.4f} {unit}"
 
 
+def _format_sample_preview(values, fmt) -> str:
+    # fmt is a bound str.format, applied via map so the loop body stays
+    # in C; the 12-sample cap keeps this cheap even for long spectra
+    preview = ", ".join(map(fmt, values[:12]))
+    if len(values) > 12:
+        preview += " …"
+    return preview
+
+
+def _format_series(values) -> str:
+    """Render a numeric series as semicolon-joined %g values.
+
+    np.char.mod formats the whole array in one C pass, which dominates a
+    per-value f-string loop once spectra reach thousands of samples.
+    """
+
+    if len(values) == 0:
+        return ""
+    return ";".join(np.char.mod("%g", np.asarray(values)))
+
+
+_EXPORT_ALL_HEADER = [
+    "library_name",
+    "material_name",
+    "category",
+    "source",
+    "wavelength_unit",
+    "reflectance_unit",
+    "wavelengths",
+    "reflectance",
+    "tags",
+    "acquisition_date",
+    "location",
+    "comments",
+]
+
+
 def _record_to_csv_row(record: SpectrumRecord) -> list[str]:
     return [
         record.library_name,
@@ -645,8 +956,8 @@ def _record_to_csv_row(record: SpectrumRecord) -> list[str]:
         record.source or "",
         record.wavelength_unit,
         record.reflectance_unit,
-        ";".join(f"{value:g}" for value in record.wavelengths),
-        ";".join(f"{value:g}" for value in record.reflectance),
+        _format_series(record.wavelengths),
+        _format_series(record.reflectance),
         ";".join(record.tags),
         record.acquisition_date.isoformat() if record.acquisition_date else "",
         record.location or "",
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QHeaderView,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -35,8 +36,19 @@ class LibraryBrowserView(QWidget):
         subtitle.setWordWrap(True)
         layout.addWidget(subtitle)
 
-        table = QTableWidget(5, 5, self)
-        table.setHorizontalHeaderLabels(
+        demo_rows = [
+            ("Basalt-01", "Global Reference", "12", "Igneous", "Review"),
+            ("Basalt-02", "Global Reference", "9", "Igneous", "Complete"),
+            ("Sandstone-01", "Sediment Study", "8", "Sedimentary", "Complete"),
+            ("Ice-12", "Ice Samples", "4", "Glacial", "Incomplete"),
+            ("Soil-04", "Soil Cores", "7", "Soil", "Review"),
+        ]
+
+        # A model fed whole rows beats a QTableWidget filled cell by
+        # cell: one view layout when the model attaches, not one per
+        # setItem, and the same path scales to real data volumes.
+        model = QStandardItemModel(0, 5, self)
+        model.setHorizontalHeaderLabels(
             [
                 "Material",
                 "Library",
@@ -45,24 +57,18 @@ class LibraryBrowserView(QWidget):
                 "Status",
             ]
         )
+        for values in demo_rows:
+            model.appendRow([QStandardItem(value) for value in values])
+
+        table = QTableView(self)
+        table.setModel(model)
         table.verticalHeader().setVisible(False)
         table.setAlternatingRowColors(True)
-        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         table.horizontalHeader().setStretchLastSection(True)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
 
-        demo_rows = [
-            ("Basalt-01", "Global Reference", "12", "Igneous", "Review"),
-            ("Basalt-02", "Global Reference", "9", "Igneous", "Complete"),
-            ("Sandstone-01", "Sediment Study", "8", "Sedimentary", "Complete"),
-            ("Ice-12", "Ice Samples", "4", "Glacial", "Incomplete"),
-            ("Soil-04", "Soil Cores", "7", "Soil", "Review"),
-        ]
-        for row, values in enumerate(demo_rows):
-            for column, value in enumerate(values):
-                table.setItem(row, column, QTableWidgetItem(value))
-
         layout.addWidget(table, 1)
 
         footer = QLabel(
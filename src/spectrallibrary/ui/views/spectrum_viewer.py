@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
+import operator
 from typing import Sequence
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QStringListModel, Qt
 from PySide6.QtWidgets import (
     QGroupBox,
     QHBoxLayout,
     QLabel,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QPushButton,
     QSplitter,
     QVBoxLayout,
@@ -19,6 +19,76 @@ from PySide6.QtWidgets import (
 
 from ...importing import SpectrumRecord
 
+# Prebuilt format callables and attribute getters: ``str.format`` reuses
+# its parsed template across calls, while f-strings re-evaluate their
+# template bytecode on every invocation.
+_FMT_ROW = "{} \u00b7 {} samples \u00b7 Library: {} \u00b7 Tags: {}".format
+_FMT_METADATA = (
+    "Spectra imported: {}\n"
+    "Materials represented: {}\n"
+    "Libraries represented: {}\n"
+    "\n"
+    "First record \u2014 Material: {}\n"
+    "Library: {}\n"
+    "Source: {}\n"
+    "Wavelength unit: {}\n"
+    "Reflectance unit: {}"
+).format
+_META_ATTRS = operator.attrgetter(
+    "material_name",
+    "library_name",
+    "source",
+    "wavelength_unit",
+    "reflectance_unit",
+)
+
+_DEMO_VERSIONS = [
+    "v3 · Imported from CSV · 2024-03-18",
+    "v2 · Metadata edit · 2024-03-10",
+    "v1 · Initial ingestion · 2024-02-28",
+]
+
+
+class _RecordListModel(QAbstractListModel):
+    """List model over imported records with lazily formatted rows.
+
+    Descriptions are built in ``data()`` the first time a row scrolls
+    into view and memoized, so a large import costs only the visible
+    rows instead of a formatted string and list item per record.
+    """
+
+    def __init__(self, records: Sequence[SpectrumRecord], parent=None) -> None:
+        super().__init__(parent)
+        self._records = records
+        self._descriptions: list[str | None] = [None] * len(records)
+
+    def setRecords(self, records: Sequence[SpectrumRecord]) -> None:
+        """Swap the backing records in one model reset."""
+
+        self.beginResetModel()
+        self._records = records
+        self._descriptions = [None] * len(records)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        text = self._descriptions[row]
+        if text is None:
+            record = self._records[row]
+            text = _FMT_ROW(
+                record.material_name,
+                len(record.wavelengths),
+                record.library_name,
+                ", ".join(record.tags) if record.tags else "none",
+            )
+            self._descriptions[row] = text
+        return text
+
 
 class SpectrumViewerView(QWidget):
     """Shows temporary widgets that mimic the intended spectrum viewer."""
@@ -67,6 +137,10 @@ class SpectrumViewerView(QWidget):
         outer_layout.addWidget(splitter, 1)
 
         self._current_records: list[SpectrumRecord] = []
+        # One reusable record model; previews swap its contents with a
+        # single reset. The demo string model stays attached until the
+        # first preview arrives.
+        self._version_model = _RecordListModel([], self)
 
         self.setLayout(outer_layout)
 
@@ -74,39 +148,38 @@ class SpectrumViewerView(QWidget):
         if not records:
             self._current_records = []
             self.metadata_label.setText("No spectra selected.")
-            self.version_list.clear()
+            self._show_record_model([])
             return
 
-        self._current_records = list(records)
+        # Keep the caller's list as-is; copying a large preview doubles
+        # peak memory for no benefit since the view never mutates it.
+        self._current_records = (
+            records if isinstance(records, list) else list(records)
+        )
         first = self._current_records[0]
         total = len(self._current_records)
-        unique_materials = len({record.material_name for record in self._current_records})
-        unique_libraries = len({record.library_name for record in self._current_records})
+
+        # Aggregate both metadata columns in a single traversal.
+        materials: set[str] = set()
+        libraries: set[str] = set()
+        for record in self._current_records:
+            materials.add(record.material_name)
+            libraries.add(record.library_name)
+        unique_materials = len(materials)
+        unique_libraries = len(libraries)
 
         self.metadata_label.setText(
-            (
-                f"Spectra imported: {total}\n"
-                f"Materials represented: {unique_materials}\n"
-                f"Libraries represented: {unique_libraries}\n"
-                "\n"
-                f"First record — Material: {first.material_name}\n"
-                f"Library: {first.library_name}\n"
-                f"Source: {first.source}\n"
-                f"Wavelength unit: {first.wavelength_unit}\n"
-                f"Reflectance unit: {first.reflectance_unit}"
-            )
+            _FMT_METADATA(total, unique_materials, unique_libraries, *_META_ATTRS(first))
         )
 
-        self.version_list.clear()
-        for record in self._current_records:
-            description = (
-                f"{record.material_name} · {len(record.wavelengths)} samples · "
-                f"Library: {record.library_name} · "
-                f"Tags: {', '.join(record.tags) if record.tags else 'none'}"
-            )
-            QListWidgetItem(description, self.version_list)
-        if self.version_list.count():
-            self.version_list.setCurrentRow(0)
+        self._show_record_model(self._current_records)
+        if total:
+            self.version_list.setCurrentIndex(self._version_model.index(0))
+
+    def _show_record_model(self, records: Sequence[SpectrumRecord]) -> None:
+        self._version_model.setRecords(records)
+        if self.version_list.model() is not self._version_model:
+            self.version_list.setModel(self._version_model)
 
 
 def _plot_group() -> QGroupBox:
@@ -124,7 +197,7 @@ def _plot_group() -> QGroupBox:
     return group
 
 
-def _metadata_group() -> tuple[QGroupBox, QLabel, QListWidget]:
+def _metadata_group() -> tuple[QGroupBox, QLabel, QListView]:
     group = QGroupBox("Metadata & Version History")
     layout = QVBoxLayout(group)
     layout.setContentsMargins(12, 12, 12, 12)
@@ -139,13 +212,9 @@ def _metadata_group() -> tuple[QGroupBox, QLabel, QListWidget]:
     metadata.setWordWrap(True)
     layout.addWidget(metadata)
 
-    version_list = QListWidget(group)
-    for text in (
-        "v3 · Imported from CSV · 2024-03-18",
-        "v2 · Metadata edit · 2024-03-10",
-        "v1 · Initial ingestion · 2024-02-28",
-    ):
-        QListWidgetItem(text, version_list)
+    version_list = QListView(group)
+    version_list.setModel(QStringListModel(_DEMO_VERSIONS, version_list))
+    version_list.setUniformItemSizes(True)
     version_list.setAlternatingRowColors(True)
     layout.addWidget(version_list)
 
@@ -4,22 +4,198 @@ from __future__ import annotations
 
 from typing import Iterable, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, Qt, Signal
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QDockWidget,
     QGroupBox,
     QLabel,
     QListWidget,
-    QListWidgetItem,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
 from ...services import LibraryBrowserService
-from ...services.library_service import LibraryNode, MaterialNode, SpectrumNode
+from ...services.library_service import LibraryTree
+
+
+class LibraryTreeModel(QAbstractItemModel):
+    """Lazy tree model over the library/material/spectrum hierarchy.
+
+    Rows are realized on demand through ``canFetchMore``/``fetchMore``,
+    so loading a large library costs the visible nodes rather than a
+    QTreeWidgetItem per spectrum. Internal ids intern the parent chain
+    — ``(level,)``, ``(level, lib_row)`` or ``(level, lib_row,
+    mat_row)`` — which together with the index row addresses any node
+    in the immutable NamedTuple tree without per-node wrappers.
+    """
+
+    _LIBRARY = 0
+    _MATERIAL = 1
+    _SPECTRUM = 2
+
+    def __init__(self, libraries: LibraryTree, parent=None) -> None:
+        super().__init__(parent)
+        self._libraries = libraries
+        self._placeholder = len(libraries) == 0
+        # Interned parent-chain keys; createIndex carries their list
+        # position as the internal id.
+        self._key_ids: dict[tuple, int] = {}
+        self._keys: list[tuple] = []
+        # Parent keys whose children have been announced to the view.
+        self._fetched: set[tuple] = set()
+        # Activation payload dicts, memoized per node so repeated role
+        # queries do not allocate a fresh dict each time.
+        self._payloads: dict[tuple[int, int], dict] = {}
+
+    def _intern(self, key: tuple) -> int:
+        key_id = self._key_ids.get(key)
+        if key_id is None:
+            key_id = len(self._keys)
+            self._key_ids[key] = key_id
+            self._keys.append(key)
+        return key_id
+
+    def _node(self, index: QModelIndex):
+        key = self._keys[index.internalId()]
+        level = key[0]
+        if level == self._LIBRARY:
+            return self._libraries[index.row()]
+        if level == self._MATERIAL:
+            return self._libraries[key[1]].materials[index.row()]
+        return self._libraries[key[1]].materials[key[2]].spectra[index.row()]
+
+    # ------------------------------------------------------------------
+    # QAbstractItemModel interface
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self._intern((self._LIBRARY,)))
+        parent_key = self._keys[parent.internalId()]
+        if parent_key[0] == self._LIBRARY:
+            return self.createIndex(row, column, self._intern((self._MATERIAL, parent.row())))
+        return self.createIndex(
+            row, column, self._intern((self._SPECTRUM, parent_key[1], parent.row()))
+        )
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        key = self._keys[index.internalId()]
+        level = key[0]
+        if level == self._LIBRARY:
+            return QModelIndex()
+        if level == self._MATERIAL:
+            return self.createIndex(key[1], 0, self._intern((self._LIBRARY,)))
+        return self.createIndex(key[2], 0, self._intern((self._MATERIAL, key[1])))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return 1 if self._placeholder else len(self._libraries)
+        if self._placeholder or parent.column() != 0:
+            return 0
+        key = self._keys[parent.internalId()]
+        level = key[0]
+        if level == self._SPECTRUM:
+            return 0
+        child_key = (
+            (self._MATERIAL, parent.row())
+            if level == self._LIBRARY
+            else (self._SPECTRUM, key[1], parent.row())
+        )
+        if child_key not in self._fetched:
+            return 0
+        return len(self._children_of(parent))
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return True
+        if self._placeholder:
+            return False
+        node = self._node(parent)
+        key = self._keys[parent.internalId()]
+        if key[0] == self._LIBRARY:
+            return len(node.materials) > 0
+        if key[0] == self._MATERIAL:
+            return len(node.spectra) > 0
+        return False
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid() or self._placeholder:
+            return False
+        key = self._keys[parent.internalId()]
+        if key[0] == self._SPECTRUM:
+            return False
+        child_key = (
+            (self._MATERIAL, parent.row())
+            if key[0] == self._LIBRARY
+            else (self._SPECTRUM, key[1], parent.row())
+        )
+        return child_key not in self._fetched and len(self._children_of(parent)) > 0
+
+    def fetchMore(self, parent: QModelIndex) -> None:
+        key = self._keys[parent.internalId()]
+        child_key = (
+            (self._MATERIAL, parent.row())
+            if key[0] == self._LIBRARY
+            else (self._SPECTRUM, key[1], parent.row())
+        )
+        children = self._children_of(parent)
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        self._fetched.add(child_key)
+        self.endInsertRows()
+
+    def _children_of(self, parent: QModelIndex):
+        node = self._node(parent)
+        key = self._keys[parent.internalId()]
+        return node.materials if key[0] == self._LIBRARY else node.spectra
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        # Paints probe several roles per visible row; bail out before
+        # resolving the node for every role this model does not serve.
+        if role != Qt.ItemDataRole.DisplayRole and role != Qt.ItemDataRole.UserRole:
+            return None
+        if not index.isValid():
+            return None
+        if self._placeholder:
+            return "No materials found yet" if role == Qt.ItemDataRole.DisplayRole else None
+        key = self._keys[index.internalId()]
+        level = key[0]
+        node = self._node(index)
+        if role == Qt.ItemDataRole.DisplayRole:
+            if level == self._LIBRARY:
+                return node.name
+            if level == self._MATERIAL:
+                return f"{node.name} · {node.category}"
+            return node.label
+        payload_key = (index.internalId(), index.row())
+        payload = self._payloads.get(payload_key)
+        if payload is None:
+            if level == self._LIBRARY:
+                payload = {"type": "library", "name": node.name}
+            elif level == self._MATERIAL:
+                payload = {"type": "material", "id": node.id, "name": node.name}
+            else:
+                payload = {
+                    "type": "spectrum",
+                    "id": node.id,
+                    "source": node.source,
+                    "quality": node.quality_status,
+                }
+            self._payloads[payload_key] = payload
+        return payload
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if self._placeholder:
+            return Qt.ItemFlag.NoItemFlags
+        return super().flags(index)
 
 
 class LibraryNavigationWidget(QWidget):
@@ -38,11 +214,35 @@ class LibraryNavigationWidget(QWidget):
         self.filter_hint = QLabel("Filter libraries and materials")
         self.filter_hint.setObjectName("LibraryFilterHint")
 
-        self.tree = QTreeWidget(self)
+        self.tree = QTreeView(self)
         self.tree.setHeaderHidden(True)
         self.tree.setUniformRowHeights(True)
-        self.tree.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        self.tree.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._model: LibraryTreeModel | None = None
+        self._last_tree: LibraryTree | None = None
+
+        # The facet and background-task boxes are built on first show,
+        # keeping their group boxes, checkboxes and list widget off the
+        # main-window construction path.
+        self.facets_box: QGroupBox | None = None
+        self.background_box: QGroupBox | None = None
+        self.task_list: QListWidget | None = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(8)
+
+        layout.addWidget(self.filter_hint)
+        layout.addWidget(self.tree, 1)
+
+        self.refresh()
+
+    def showEvent(self, event) -> None:  # pragma: no cover - UI lifecycle hook
+        if self.facets_box is None:
+            self._build_deferred_sections()
+        super().showEvent(event)
 
+    def _build_deferred_sections(self) -> None:
         self.facets_box = QGroupBox("Facets", self)
         self.facets_box.setFlat(True)
 
@@ -66,125 +266,117 @@ class LibraryNavigationWidget(QWidget):
         bg_layout.addWidget(self.task_list)
         self.background_box.setLayout(bg_layout)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(8)
-
-        layout.addWidget(self.filter_hint)
-        layout.addWidget(self.tree, 1)
+        layout = self.layout()
         layout.addWidget(self.facets_box)
         layout.addWidget(self.background_box)
 
-        self.refresh()
+    def invalidate(self) -> None:
+        """Drop the service's cached tree before the next refresh."""
+
+        self._service.invalidate()
 
     def refresh(self) -> None:
         """Reload navigation content from the service."""
 
         libraries = self._service.fetch_library_tree()
-        self.tree.clear()
 
-        if not libraries:
-            placeholder = QTreeWidgetItem(["No materials found yet"])
-            placeholder.setFlags(Qt.ItemFlag.NoItemFlags)
-            self.tree.addTopLevelItem(placeholder)
+        # The service returns its cached tree object verbatim while the
+        # underlying tables' version token is unchanged, so an identity
+        # match means the Qt model is already current — refreshes from
+        # tab switches and focus events become free.
+        if libraries is self._last_tree and self._model is not None:
             return
-
-        for library in libraries:
-            library_item = self._make_library_item(library)
-            self.tree.addTopLevelItem(library_item)
-
-        self.tree.expandToDepth(1)
+        self._last_tree = libraries
+
+        # One repaint for the whole swap-and-expand instead of a redraw
+        # cascade per inserted/expanded row.
+        old_model = self._model
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self._model = LibraryTreeModel(libraries, self.tree)
+            self.tree.setModel(self._model)
+
+            # Expand libraries only: this fetches material rows but
+            # leaves every spectrum list unrealized until its material
+            # is opened.
+            self.tree.expandToDepth(0)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+        # Superseded models are parented to the tree and would otherwise
+        # pin their tree snapshots for the widget's lifetime.
+        if old_model is not None:
+            old_model.deleteLater()
+
+    def selected_path(self) -> tuple[str, ...]:
+        """Return the root→selection display texts as a tuple."""
+
+        texts: list[str] = []
+        index = self.tree.currentIndex()
+        while index.isValid():
+            texts.append(index.data(Qt.ItemDataRole.DisplayRole))
+            index = index.parent()
+        return tuple(reversed(texts))
 
     def selected_hierarchy(self) -> Iterable[str]:
-        """Return the text of the selected tree item and its parents."""
-
-        item = self.tree.currentItem()
-        while item is not None:
-            yield item.text(0)
-            item = item.parent()
-
-    # ------------------------------------------------------------------
-    # Tree construction helpers
-
-    def _make_library_item(self, library: LibraryNode) -> QTreeWidgetItem:
-        item = QTreeWidgetItem([library.name])
-        item.setData(0, Qt.ItemDataRole.UserRole, {"type": "library", "name": library.name})
-
-        for material in library.materials:
-            item.addChild(self._make_material_item(material))
-
-        return item
+        """Return the text of the selected tree item and its parents.
 
-    def _make_material_item(self, material: MaterialNode) -> QTreeWidgetItem:
-        label = f"{material.name} · {material.category}"
-        item = QTreeWidgetItem([label])
-        item.setData(
-            0,
-            Qt.ItemDataRole.UserRole,
-            {"type": "material", "id": material.id, "name": material.name},
-        )
+        Kept for callers expecting child→root order; prefer
+        :meth:`selected_path` which builds the tuple in one pass.
+        """
 
-        for spectrum in material.spectra:
-            item.addChild(self._make_spectrum_item(spectrum))
-
-        return item
-
-    def _make_spectrum_item(self, spectrum: SpectrumNode) -> QTreeWidgetItem:
-        item = QTreeWidgetItem([spectrum.label])
-        item.setData(
-            0,
-            Qt.ItemDataRole.UserRole,
-            {
-                "type": "spectrum",
-                "id": spectrum.id,
-                "source": spectrum.source,
-                "quality": spectrum.quality_status,
-            },
-        )
-        return item
+        return reversed(self.selected_path())
 
 
 class ContextSummaryWidget(QWidget):
     """Right-hand context panel showing metadata, tasks, and plugin slots."""
 
-    def __init__(self, parent: QWidget | None = None) -> None:
-        super().__init__(parent)
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(8, 8, 8, 8)
-        layout.setSpacing(12)
-
-        self.metadata_group = _info_group(
+    _GROUP_SPECS = (
+        (
             "Metadata",
-            [
+            (
                 "Material: Basalt-01",
                 "Library: Global Reference",
                 "Source: ASD FieldSpec 4",
                 "Status: In review",
-            ],
-        )
-        layout.addWidget(self.metadata_group)
-
-        self.activity_group = _info_group(
+            ),
+        ),
+        (
             "Activity",
-            [
+            (
                 "• Imported 3 minutes ago",
                 "• Tagged by analyst",
                 "• No outstanding checks",
-            ],
-        )
-        layout.addWidget(self.activity_group)
-
-        self.plugin_group = _info_group(
+            ),
+        ),
+        (
             "Plugin widgets",
-            [
+            (
                 "Plugins can inject additional controls here.",
                 "Use the Plugin Hub to enable extensions.",
-            ],
-        )
-        layout.addWidget(self.plugin_group)
+            ),
+        ),
+    )
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+        layout.setSpacing(12)
+
+        # Group boxes are materialized from _GROUP_SPECS on first show
+        # so panel construction stays off the startup path.
+        self._groups_built = False
 
-        layout.addStretch(1)
+    def showEvent(self, event) -> None:  # pragma: no cover - UI lifecycle hook
+        if not self._groups_built:
+            self._groups_built = True
+            layout = self.layout()
+            for title, lines in self._GROUP_SPECS:
+                layout.addWidget(_info_group(title, lines))
+            layout.addStretch(1)
+        super().showEvent(event)
 
 
 def _info_group(title: str, lines: Iterable[str]) -> QGroupBox:
@@ -223,10 +415,10 @@ class NavigationDock(QDockWidget):
         content.setLayout(layout)
         self.setWidget(content)
 
-        self.navigation.tree.itemActivated.connect(self._handle_tree_activation)
+        self.navigation.tree.activated.connect(self._handle_tree_activation)
 
-    def _handle_tree_activation(self, item: QTreeWidgetItem) -> None:
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+    def _handle_tree_activation(self, index: QModelIndex) -> None:
+        data = index.data(Qt.ItemDataRole.UserRole)
         if isinstance(data, dict):
             target_type = data.get("type")
             mapping = {
@@ -237,6 +429,11 @@ class NavigationDock(QDockWidget):
             if target_type in mapping:
                 self.view_requested.emit(mapping[target_type])
 
+    def invalidate(self) -> None:
+        """Drop the cached navigation tree before the next refresh."""
+
+        self.navigation.invalidate()
+
     def refresh(self) -> None:
         """Reload navigation data from the underlying service."""
 
@@ -0,0 +1 @@
+"""Shared utility helpers for the Spectral Library application."""
@@ -0,0 +1,25 @@
+"""File hashing helpers for import provenance."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+
+def sha256_of_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file.
+
+    Uses :func:`hashlib.file_digest` (Python 3.11+), which reads through a
+    zero-copy buffer and benefits from SHA-NI acceleration where the
+    interpreter's OpenSSL build supports it — noticeably faster than a
+    manual read/update loop during bulk ingestion. Importers should use
+    this when populating ``SourceFile.sha256``.
+    """
+
+    with path.open("rb") as handle:
+        if hasattr(os, "posix_fadvise"):
+            # Hint sequential access so the kernel prefetches ahead of the
+            # hashing loop.
+            os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return hashlib.file_digest(handle, "sha256").hexdigest()
@@ -1,18 +1,170 @@
 from __future__ import annotations
 
+import csv
+import io
 import os
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
-from PySide6.QtWidgets import QApplication
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
-from spectrallibrary.ui import create_application
+from spectrallibrary.db.base import Base
+from spectrallibrary.db.engine import get_engine
+from spectrallibrary.db.session import configure_session
+
+# Selected before any Qt platform probing happens: offscreen skips the
+# X11/Wayland handshake entirely for the whole test session.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
+
+    from spectrallibrary.ui import MainWindow
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """Pin Qt tests to a single pytest-xdist worker.
+
+    A QApplication cannot be shared across xdist workers, so every test
+    touching the session-wide ``ui_app`` fixture is marked ``qt_serial``
+    and scheduled into one ``xdist_group``. Non-Qt tests remain free to
+    spread across workers under ``-n auto``.
+    """
+
+    for item in items:
+        if "ui_app" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.qt_serial)
+            item.add_marker(pytest.mark.xdist_group("qt"))
+
+
+@pytest.fixture(scope="session")
+def shared_sqlite_engine():
+    """One in-memory engine for all db tests; schema DDL runs once.
+
+    StaticPool pins a single connection so the :memory: database
+    survives across checkouts; tests clear rows instead of re-running
+    create_all/drop_all per test.
+    """
+
+    # Workers are separate processes, so anonymous :memory: would
+    # already be isolated; a worker-keyed shared-cache URI makes that
+    # explicit and keeps any future extra connection in the same DB.
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    engine = create_engine(
+        f"sqlite+pysqlite:///file:memdb_{worker_id}?mode=memory&cache=shared&uri=true",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def reset_database(engine) -> None:
+    """Delete all rows in dependency order inside one transaction."""
+
+    with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture
+def use_shared_database(shared_sqlite_engine):
+    """Bind sessions to the shared engine and wipe rows afterwards.
+
+    Modules opt in with a one-line autouse wrapper, so the engine swap
+    and row cleanup live in one place instead of per-file copies.
+    """
+
+    original_engine = get_engine()
+    configure_session(shared_sqlite_engine)
+    try:
+        yield shared_sqlite_engine
+    finally:
+        reset_database(shared_sqlite_engine)
+        configure_session(original_engine)
+
+
+def make_csv(rows: list[dict[str, str]]) -> str:
+    """Render rows through csv.DictWriter, mirroring the importer path.
+
+    Building fixtures with the csv module instead of string
+    concatenation keeps quoting/escaping consistent with what the
+    importer reads back, and scales to many-row stress fixtures
+    without per-row string joins.
+    """
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]), lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def canonical_sample_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A valid single-record CSV written once and shared read-only."""
+
+    path = tmp_path_factory.mktemp("csv") / "sample.csv"
+    content = make_csv(
+        [
+            {
+                "library_name": "Global Reference",
+                "material_name": "Basalt-01",
+                "category": "Igneous",
+                "source": "ASD FieldSpec 4",
+                "wavelength_unit": "nm",
+                "reflectance_unit": "fraction",
+                "wavelengths": "400;401",
+                "reflectance": "0.11;0.12",
+                "tags": "peak-a;peak-b",
+                "acquisition_date": "2024-03-14",
+            }
+        ]
+    )
+    path.write_bytes(content.encode("utf-8"))
+    return path
 
 
 @pytest.fixture(scope="session")
 def ui_app() -> QApplication:
     """Provide a shared QApplication for UI-focused tests."""
-    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # Imported here so collecting non-UI tests never loads PySide6.
+    from PySide6.QtWidgets import QApplication
+
+    from spectrallibrary.ui import create_application
+
     app = QApplication.instance()
     if app is None:
         app = create_application([])
     return app
+
+
+@pytest.fixture(scope="module")
+def _module_main_window(ui_app: QApplication) -> MainWindow:
+    """One MainWindow per test module; construction dominates UI tests."""
+
+    from spectrallibrary.ui import MainWindow
+
+    window = MainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+    ui_app.processEvents()
+
+
+@pytest.fixture
+def main_window(_module_main_window: MainWindow, ui_app: QApplication) -> MainWindow:
+    """The module window with viewer-shortcut state reset between tests."""
+
+    window = _module_main_window
+    window._pending_viewer_records = None
+    if window._viewer_shortcut_timer is not None:
+        window._viewer_shortcut_timer.stop()
+    window._hide_viewer_shortcut()
+    window._switch_to("library")
+    ui_app.processEvents()
+    return window
@@ -7,12 +7,14 @@ import pytest
 from spectrallibrary.importing import ImportContext, importer_registry
 
 
-@pytest.fixture
+# The .sig fixtures are read-only inputs, so one path per session is
+# safe even when tests run in parallel workers.
+@pytest.fixture(scope="session")
 def asd_fixture_path() -> Path:
     return Path(__file__).parent / "fixtures" / "asd" / "sample_reflectance.sig"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def asd_radiance_path() -> Path:
     return Path(__file__).parent / "fixtures" / "asd" / "sample_radiance.sig"
 
@@ -25,6 +27,9 @@ def test_asd_importer_detects_file(asd_fixture_path: Path) -> None:
             break
     assert importer is not None, "ASD importer should handle .sig files"
 
+    # The suffix index must dispatch to the same importer without a scan.
+    assert importer in importer_registry.importers_for_suffix(asd_fixture_path.suffix)
+
 
 def test_asd_importer_parses_reflectance(asd_fixture_path: Path) -> None:
     result = importer_registry.import_file(asd_fixture_path, context=ImportContext(target_library="Campaign"))
@@ -38,8 +43,8 @@ def test_asd_importer_parses_reflectance(asd_fixture_path: Path) -> None:
     assert record.source.startswith("ASD FieldSpec 4")
     assert record.wavelength_unit == "nm"
     assert record.reflectance_unit == "ratio"
-    assert record.wavelengths == [350.0, 351.0, 352.0]
-    assert record.reflectance == [0.11, 0.12, 0.13]
+    assert list(record.wavelengths) == pytest.approx([350.0, 351.0, 352.0])
+    assert list(record.reflectance) == pytest.approx([0.11, 0.12, 0.13])
     assert "asd" in record.tags
 
     assert not result.warnings
@@ -53,6 +58,6 @@ def test_asd_importer_handles_radiance_only(asd_radiance_path: Path) -> None:
 
     assert record.material_name == "Quartz-01"
     assert record.reflectance_unit == "radiance"
-    assert record.reflectance == [1.01, 0.99, 0.97]
+    assert list(record.reflectance) == pytest.approx([1.01, 0.99, 0.97])
     assert result.warnings
     assert any("Reflectance column missing" in warning for warning in result.warnings)
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import io
 from pathlib import Path
 
 import pytest
 
+from conftest import make_csv
 from spectrallibrary.importing.csv_importer import CsvSpectrumImporter
 from spectrallibrary.importing.base import ImportContext
 
@@ -16,16 +16,29 @@ def csv_importer() -> CsvSpectrumImporter:
 
 def _write_temp_csv(tmp_path: Path, content: str) -> Path:
     path = tmp_path / "sample.csv"
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(content.encode("utf-8"))
     return path
 
 
-def test_importer_parses_valid_rows(tmp_path: Path, csv_importer: CsvSpectrumImporter) -> None:
-    content = """library_name,material_name,category,source,wavelength_unit,reflectance_unit,wavelengths,reflectance,tags\n"""
-    content += "Global Reference,Basalt-01,Igneous,ASD, nm, fraction,400;500,0.1;0.2,peak-a;peak-b\n"
-    path = _write_temp_csv(tmp_path, content)
+def _row(**overrides: str) -> dict[str, str]:
+    row = {
+        "library_name": "Original",
+        "material_name": "Material",
+        "category": "Igneous",
+        "source": "ASD",
+        "wavelength_unit": "nm",
+        "reflectance_unit": "fraction",
+        "wavelengths": "400;500",
+        "reflectance": "0.1;0.2",
+    }
+    row.update(overrides)
+    return row
 
-    result = csv_importer.load(path)
+
+def test_importer_parses_valid_rows(
+    canonical_sample_csv: Path, csv_importer: CsvSpectrumImporter
+) -> None:
+    result = csv_importer.load(canonical_sample_csv)
 
     assert len(result.records) == 1
     record = result.records[0]
@@ -34,18 +47,25 @@ def test_importer_parses_valid_rows(tmp_path: Path, csv_importer: CsvSpectrumImp
 
 
 def test_importer_respects_context_override(tmp_path: Path, csv_importer: CsvSpectrumImporter) -> None:
-    content = """library_name,material_name,category,source,wavelength_unit,reflectance_unit,wavelengths,reflectance\n"""
-    content += "Original,Material,Igneous,ASD,nm,fraction,400;500,0.1;0.2\n"
-    path = _write_temp_csv(tmp_path, content)
+    path = _write_temp_csv(tmp_path, make_csv([_row(library_name="Original")]))
 
     result = csv_importer.load(path, context=ImportContext(target_library="Override"))
     assert result.records[0].library_name == "Override"
 
 
 def test_importer_collects_row_warnings(tmp_path: Path, csv_importer: CsvSpectrumImporter) -> None:
-    content = """library_name,material_name,category,source,wavelength_unit,reflectance_unit,wavelengths,reflectance\n"""
-    content += ",Material,Igneous,ASD,nm,fraction,400;500,0.1;0.2\n"  # missing library
-    path = _write_temp_csv(tmp_path, content)
+    path = _write_temp_csv(tmp_path, make_csv([_row(library_name="")]))
+
+    result = csv_importer.load(path)
+
+    assert result.records == []
+    assert result.warnings
+
+
+def test_importer_rejects_malformed_series_token(
+    tmp_path: Path, csv_importer: CsvSpectrumImporter
+) -> None:
+    path = _write_temp_csv(tmp_path, make_csv([_row(reflectance="0.1;abc;0.3")]))
 
     result = csv_importer.load(path)
 
@@ -60,8 +80,9 @@ def test_importer_requires_header(tmp_path: Path, csv_importer: CsvSpectrumImpor
 
 
 def test_importer_rejects_missing_columns(tmp_path: Path, csv_importer: CsvSpectrumImporter) -> None:
-    content = """library_name,material_name\nfoo,bar\n"""
-    path = _write_temp_csv(tmp_path, content)
+    path = _write_temp_csv(
+        tmp_path, make_csv([{"library_name": "foo", "material_name": "bar"}])
+    )
 
     with pytest.raises(ValueError):
         csv_importer.load(path)
@@ -4,20 +4,22 @@ from __future__ import annotations
 
 from datetime import date
 
+import numpy as np
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import func, insert, inspect, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
 
-from spectrallibrary.db import Base, configure_engine, get_session
+from conftest import reset_database
+from spectrallibrary.db import bulk_load_indexes, configure_engine, get_session
 from spectrallibrary.db.models import Material, Spectrum, SpectrumPoint, Tag
 
 
 @pytest.fixture()
-def in_memory_db():
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(engine)
-    configure_engine(engine)
-    yield engine
-    Base.metadata.drop_all(engine)
+def in_memory_db(shared_sqlite_engine):
+    configure_engine(shared_sqlite_engine)
+    yield shared_sqlite_engine
+    reset_database(shared_sqlite_engine)
 
 
 def test_material_spectrum_relationship(in_memory_db):
@@ -48,9 +50,84 @@ def test_material_spectrum_relationship(in_memory_db):
 
         tag = Tag(name="baseline")
         spectrum.tags.append(tag)
-        material.spectra.append(spectrum)
+        session.add(spectrum)
 
     with get_session() as session:
-        stored = session.query(Material).filter_by(material_name="Basalt").one()
+        stored = (
+            session.query(Material)
+            .options(
+                selectinload(Material.spectra).selectinload(Spectrum.points),
+                selectinload(Material.spectra).selectinload(Spectrum.tags),
+            )
+            .filter_by(material_name="Basalt")
+            .one()
+        )
         assert stored.spectra[0].points[0].wavelength == pytest.approx(350.0)
         assert stored.spectra[0].tags[0].name == "baseline"
+
+
+def test_bulk_spectrum_points_insert(in_memory_db):
+    # Covers the Core executemany fast path the import service uses for
+    # point rows; it skips per-object unit-of-work bookkeeping.
+    wavelengths = np.arange(10_000, dtype=np.float64)
+
+    with get_session() as session:
+        spectrum = Spectrum(
+            material=Material(
+                library_name="USGS",
+                material_name="Olivine",
+                category="Mineral",
+            ),
+            source="ASD FieldSpec 4",
+            wavelength_unit="nm",
+            reflectance_unit="fraction",
+        )
+        session.add(spectrum)
+        session.flush()
+
+        session.execute(
+            insert(SpectrumPoint),
+            [
+                {
+                    "spectrum_id": spectrum.id,
+                    "order_index": index,
+                    "wavelength": float(wavelength),
+                    "reflectance": float(wavelength) * 1e-4,
+                }
+                for index, wavelength in enumerate(wavelengths, start=1)
+            ],
+        )
+
+    with get_session() as session:
+        count = session.execute(
+            select(func.count()).select_from(SpectrumPoint)
+        ).scalar_one()
+        assert count == len(wavelengths)
+
+
+def test_hot_relationships_require_eager_loading(in_memory_db):
+    with get_session() as session:
+        material = Material(
+            library_name="USGS",
+            material_name="Quartz",
+            category="Mineral",
+        )
+        session.add(material)
+
+    with get_session() as session:
+        stored = session.query(Material).filter_by(material_name="Quartz").one()
+        with pytest.raises(InvalidRequestError):
+            _ = stored.spectra
+
+
+def test_bulk_load_indexes_drops_and_restores(in_memory_db):
+    def point_index_names() -> set[str]:
+        inspector = inspect(in_memory_db)
+        return {index["name"] for index in inspector.get_indexes("spectrum_points")}
+
+    assert "ix_spectrum_points_spectrum_id" in point_index_names()
+
+    with bulk_load_indexes(in_memory_db):
+        assert "ix_spectrum_points_spectrum_id" not in point_index_names()
+
+    assert "ix_spectrum_points_spectrum_id" in point_index_names()
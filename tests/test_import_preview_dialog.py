@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import csv
+import time
 
 import pytest  # type: ignore[import-not-found]
 
@@ -11,6 +12,7 @@ pytestmark = pytest.mark.filterwarnings(
     "ignore:.*AA_UseHighDpiPixmaps.*:DeprecationWarning",
 )
 
+from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QDialogButtonBox, QFileDialog
 
 from spectrallibrary.importing import ImportResult, SpectrumRecord
@@ -33,6 +35,18 @@ def _make_record(material: str, reflectance: list[float] | None = None) -> Spect
     )
 
 
+_DUMMY_SOURCE = b"dummy source"
+
+
+def _wait_for_export(dialog: ImportPreviewDialog) -> None:
+    """Pump the event loop just until the export worker is torn down."""
+
+    deadline = time.monotonic() + 5.0
+    while dialog._export_thread is not None:
+        assert time.monotonic() < deadline, "export worker did not finish in time"
+        QTest.qWait(1)
+
+
 def _find_button(dialog: ImportPreviewDialog, text: str):
     button_box = dialog.findChild(QDialogButtonBox)
     assert button_box is not None, "dialog should include a button box"
@@ -45,7 +59,7 @@ def _find_button(dialog: ImportPreviewDialog, text: str):
 def test_preview_export_selected_record(ui_app, tmp_path, monkeypatch) -> None:
     export_path = tmp_path / "selected.csv"
     source_path = tmp_path / "source.csv"
-    source_path.write_text("dummy source", encoding="utf-8")
+    source_path.write_bytes(_DUMMY_SOURCE)
 
     record = _make_record("Sample A")
     result = ImportResult(records=[record])
@@ -61,7 +75,7 @@ def test_preview_export_selected_record(ui_app, tmp_path, monkeypatch) -> None:
 
     button = _find_button(dialog, "Export selected…")
     button.click()
-    ui_app.processEvents()
+    _wait_for_export(dialog)
 
     with export_path.open(newline="", encoding="utf-8") as handle:
         rows = list(csv.reader(handle))
@@ -75,13 +89,13 @@ def test_preview_export_selected_record(ui_app, tmp_path, monkeypatch) -> None:
     assert reflectance == pytest.approx([0.12, 0.34, 0.56])
 
     dialog.close()
-    ui_app.processEvents()
+    dialog.deleteLater()
 
 
 def test_preview_export_all_records(ui_app, tmp_path, monkeypatch) -> None:
     export_path = tmp_path / "preview.csv"
     source_path = tmp_path / "import.csv"
-    source_path.write_text("dummy source", encoding="utf-8")
+    source_path.write_bytes(_DUMMY_SOURCE)
 
     records = [
         _make_record("Sample A"),
@@ -100,7 +114,7 @@ def test_preview_export_all_records(ui_app, tmp_path, monkeypatch) -> None:
 
     button = _find_button(dialog, "Export all previewed…")
     button.click()
-    ui_app.processEvents()
+    _wait_for_export(dialog)
 
     with export_path.open(newline="", encoding="utf-8") as handle:
         rows = list(csv.reader(handle))
@@ -112,4 +126,4 @@ def test_preview_export_all_records(ui_app, tmp_path, monkeypatch) -> None:
     assert rows[2][6] == "400;410;420"
 
     dialog.close()
-    ui_app.processEvents()
+    dialog.deleteLater()
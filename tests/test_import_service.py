@@ -4,48 +4,45 @@ from datetime import date
 from pathlib import Path
 
 import pytest
-from sqlalchemy import create_engine, func, select
+from sqlalchemy import func, select
 
-from spectrallibrary.db.base import Base
-from spectrallibrary.db.engine import get_engine
+from conftest import make_csv
 from spectrallibrary.db.models import Material, Spectrum, Tag
-from spectrallibrary.db.session import configure_session, get_session
+from spectrallibrary.db.session import get_session
 from spectrallibrary.importing import importer_registry
 from spectrallibrary.services import ImportService
 
 
 @pytest.fixture(autouse=True)
-def _use_in_memory_database(tmp_path):
-    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
-    Base.metadata.create_all(engine)
-
-    original_engine = get_engine()
-    configure_session(engine)
-    try:
-        yield
-    finally:
-        configure_session(original_engine)
-        engine.dispose()
+def _use_in_memory_database(use_shared_database):
+    yield
 
 
 @pytest.fixture
-def sample_csv(tmp_path: Path) -> Path:
-    path = tmp_path / "sample.csv"
-    path.write_text(
-        """library_name,material_name,category,source,wavelength_unit,reflectance_unit,wavelengths,reflectance,acquisition_date\n"""
-        "Global Reference,Basalt-01,Igneous,ASD FieldSpec 4,nm,fraction,400;401,0.11;0.12,2024-03-14\n",
-        encoding="utf-8",
-    )
-    return path
+def sample_csv(canonical_sample_csv: Path) -> Path:
+    # The happy-path imports only read the file, so every test shares
+    # the session-scoped canonical CSV instead of rewriting it.
+    return canonical_sample_csv
 
 
 @pytest.fixture
 def invalid_csv(tmp_path: Path) -> Path:
     path = tmp_path / "invalid.csv"
-    path.write_text(
-        """library_name,material_name,category,source,wavelength_unit,reflectance_unit,wavelengths,reflectance\n"""
-        "Global Reference,Basalt-01,Igneous,ASD FieldSpec 4,nm,fraction,,0.11;0.12\n",
-        encoding="utf-8",
+    path.write_bytes(
+        make_csv(
+            [
+                {
+                    "library_name": "Global Reference",
+                    "material_name": "Basalt-01",
+                    "category": "Igneous",
+                    "source": "ASD FieldSpec 4",
+                    "wavelength_unit": "nm",
+                    "reflectance_unit": "fraction",
+                    "wavelengths": "",
+                    "reflectance": "0.11;0.12",
+                }
+            ]
+        ).encode("utf-8")
     )
     return path
 
@@ -100,13 +97,21 @@ def test_import_service_reports_progress(sample_csv: Path) -> None:
 
 def test_import_service_reuses_existing_tags(tmp_path: Path) -> None:
     csv_path = tmp_path / "with_tags.csv"
-    csv_path.write_text(
-        """library_name,material_name,category,source,wavelength_unit,reflectance_unit,wavelengths,reflectance,tags
-Campaign,Basalt A,Igneous,ASD FieldSpec 4,nm,ratio,400;401,0.1;0.2,basalt;field
-Campaign,Basalt B,Igneous,ASD FieldSpec 4,nm,ratio,400;401,0.2;0.3,basalt;field
-""",
-        encoding="utf-8",
-    )
+    rows = [
+        {
+            "library_name": "Campaign",
+            "material_name": name,
+            "category": "Igneous",
+            "source": "ASD FieldSpec 4",
+            "wavelength_unit": "nm",
+            "reflectance_unit": "ratio",
+            "wavelengths": "400;401",
+            "reflectance": reflectance,
+            "tags": "basalt;field",
+        }
+        for name, reflectance in (("Basalt A", "0.1;0.2"), ("Basalt B", "0.2;0.3"))
+    ]
+    csv_path.write_bytes(make_csv(rows).encode("utf-8"))
 
     service = ImportService()
     summary = service.import_path(csv_path)
@@ -120,6 +125,22 @@ Campaign,Basalt B,Igneous,ASD FieldSpec 4,nm,ratio,400;401,0.2;0.3,basalt;field
     assert tag_count == 2
 
 
+def test_import_paths_reports_unreadable_file_without_aborting(
+    sample_csv: Path, tmp_path: Path
+) -> None:
+    service = ImportService()
+    missing = tmp_path / "gone.csv"
+    calls: list[tuple[int, int]] = []
+
+    summary = service.import_paths(
+        [missing, sample_csv], progress_callback=lambda done, total: calls.append((done, total))
+    )
+
+    assert summary.created_spectra == 1
+    assert any("gone.csv" in warning for warning in summary.warnings)
+    assert calls[-1] == (2, 2)
+
+
 def test_importer_registry_returns_empty_result_with_warnings(invalid_csv: Path) -> None:
     result = importer_registry.import_file(invalid_csv)
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import re
+
 import pytest  # type: ignore[import-not-found]
 
 pytest.importorskip("PySide6")
@@ -9,13 +11,35 @@ pytestmark = pytest.mark.filterwarnings(
     "ignore:.*AA_UseHighDpiPixmaps.*:DeprecationWarning",
 )
 
-from spectrallibrary.importing import SpectrumRecord
-from spectrallibrary.ui import MainWindow
-from spectrallibrary.ui.views.import_wizard import ImportWizardView
-from spectrallibrary.ui.views.spectrum_viewer import SpectrumViewerView
+def _drain(app) -> None:
+    """Flush posted events once instead of pumping after every step."""
+
+    from PySide6.QtCore import QEventLoop
+
+    app.sendPostedEvents()
+    app.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 0)
+
+
+# One compiled scan asserts the whole metadata summary at once.
+_METADATA_RE = re.compile(
+    r"Spectra imported: (\d+).*"
+    r"Materials represented: (\d+).*"
+    r"Libraries represented: (\d+)",
+    re.S,
+)
+
+# Shared immutable payloads: records are read-only after construction,
+# so every _make_record call can reuse the same tuples.
+_WAVELENGTHS = (400.0, 410.0, 420.0)
+_REFLECTANCE = (0.12, 0.34, 0.56)
+_TAGS = ("preview",)
+
 
+def _make_record(material: str):
+    # Deferred so pytest collection of this module stays import-light;
+    # sys.modules makes repeat calls free.
+    from spectrallibrary.importing import SpectrumRecord
 
-def _make_record(material: str) -> SpectrumRecord:
     return SpectrumRecord(
         library_name="QA Library",
         material_name=material,
@@ -23,68 +47,66 @@ def _make_record(material: str) -> SpectrumRecord:
         source="Demo",
         wavelength_unit="nm",
         reflectance_unit="unitless",
-        wavelengths=[400.0, 410.0, 420.0],
-        reflectance=[0.12, 0.34, 0.56],
-        tags=["preview"],
+        wavelengths=_WAVELENGTHS,
+        reflectance=_REFLECTANCE,
+        tags=list(_TAGS),
     )
 
 
-def test_main_window_opens_viewer_for_imported_records(ui_app) -> None:
-    window = MainWindow()
-    try:
-        window.show()
-        ui_app.processEvents()
-
-        import_view = window._views.get("import")
-        assert isinstance(import_view, ImportWizardView)
-
-        records = [_make_record("Sample A"), _make_record("Sample B")]
-        import_view.import_records_ready.emit(records)
-        ui_app.processEvents()
-
-        shortcut = window._viewer_shortcut_button
-        assert shortcut is not None and shortcut.isVisible()
-        assert "spectra" in shortcut.text().lower()
-
-        shortcut.click()
-        ui_app.processEvents()
-
-        current = window.centralWidget().currentWidget()
-        assert current is window._views["spectra"]
-        viewer = window._views["spectra"]
-        assert isinstance(viewer, SpectrumViewerView)
-        metadata_text = viewer.metadata_label.text()
-        assert "Spectra imported: 2" in metadata_text
-        assert "Materials represented: 2" in metadata_text
-        assert "Libraries represented: 1" in metadata_text
-
-        ui_app.processEvents()
-        assert not shortcut.isVisible()
-    finally:
-        window.close()
-        ui_app.processEvents()
-
-
-def test_main_window_hides_shortcut_when_no_records(ui_app) -> None:
-    window = MainWindow()
-    try:
-        window.show()
-        ui_app.processEvents()
-
-        import_view = window._views.get("import")
-        assert isinstance(import_view, ImportWizardView)
-        viewer = window._views.get("spectra")
-        assert isinstance(viewer, SpectrumViewerView)
-
-        import_view.import_records_ready.emit([])
-        ui_app.processEvents()
-
-        shortcut = window._viewer_shortcut_button
-        assert shortcut is not None
-        assert not shortcut.isVisible()
-
-        viewer.show_import_preview([])
-        assert viewer.metadata_label.text() == "No spectra selected."
-    finally:
-        window.close()
-        ui_app.processEvents()
+def test_main_window_opens_viewer_for_imported_records(main_window, ui_app) -> None:
+    window = main_window
+    window.show()
+    _drain(ui_app)
+
+    import_view = window.import_view
+
+    # The signal and button connections run synchronously on this
+    # thread, so no event pumping is needed between the steps.
+    records = [_make_record("Sample A"), _make_record("Sample B")]
+    import_view.import_records_ready.emit(records)
+
+    shortcut = window._viewer_shortcut_button
+    assert shortcut is not None and shortcut.isVisible()
+    assert "spectra" in shortcut.text().lower()
+
+    shortcut.click()
+    _drain(ui_app)
+
+    viewer = window.spectrum_viewer
+    assert window.centralWidget().currentWidget() is viewer
+    match = _METADATA_RE.search(viewer.metadata_label.text())
+    assert match is not None and match.groups() == ("2", "2", "1")
+    assert not shortcut.isVisible()
+
+    # Clearing the preview reuses the already-built viewer.
+    viewer.show_import_preview([])
+    assert viewer.metadata_label.text() == "No spectra selected."
+
+
+def test_main_window_refreshes_navigation_on_import_completed(main_window, ui_app) -> None:
+    from spectrallibrary.services import ImportSummary
+
+    window = main_window
+    window.show()
+    _drain(ui_app)
+
+    summary = ImportSummary(created_materials=1, created_spectra=2, warnings=())
+    window.import_view.import_completed.emit(summary)
+    # The completion slot is queued; pump once so it runs.
+    _drain(ui_app)
+
+    assert "Imported 2 spectra" in window.statusBar().currentMessage()
+
+
+def test_main_window_hides_shortcut_when_no_records(main_window, ui_app) -> None:
+    window = main_window
+    window.show()
+    _drain(ui_app)
+
+    import_view = window.import_view
+
+    import_view.import_records_ready.emit([])
+
+    shortcut = window._viewer_shortcut_button
+    assert shortcut is not None
+    assert not shortcut.isVisible()
@@ -11,8 +11,6 @@ pytestmark = pytest.mark.filterwarnings(
 
 from PySide6.QtWidgets import QApplication
 
-from spectrallibrary.ui import MainWindow  # noqa: E402
-
 
 def test_application_sets_expected_metadata(ui_app) -> None:
     assert QApplication.instance() is ui_app
@@ -20,14 +18,9 @@ def test_application_sets_expected_metadata(ui_app) -> None:
     assert ui_app.organizationName() == "SpectralLibrary"
 
 
-def test_main_window_switches_views(ui_app) -> None:
-    window = MainWindow()
-    try:
-        window._switch_to("library")
-        assert window.centralWidget().currentWidget() is window._views["library"]
+def test_main_window_switches_views(main_window) -> None:
+    main_window._switch_to("library")
+    assert main_window.centralWidget().currentWidget() is main_window._views["library"]
 
-        window._switch_to("spectra")
-        assert window.centralWidget().currentWidget() is window._views["spectra"]
-    finally:
-        window.close()
-        ui_app.processEvents()
+    main_window._switch_to("spectra")
+    assert main_window.centralWidget().currentWidget() is main_window._views["spectra"]